@@ -24,13 +24,34 @@ class Camera:
         # State
         self.active = False
         self.priority = 0  # Higher priority overrides
+
+        # View matrix cache: camera world matrix bytes it was computed from, and the result
+        self._view_key = None
+        self._view_matrix = None
         
         # logger.debug("Camera initialized")
 
     def get_view_matrix(self) -> np.ndarray:
-        """Get view matrix (inverse of camera transform)."""
+        """Get view matrix (inverse of camera transform). Read-only; recomputed only when the camera moves."""
         world_matrix = self.transform.get_world_matrix()
-        return np.linalg.inv(world_matrix)
+        key = world_matrix.tobytes()
+        if key == self._view_key:
+            return self._view_matrix
+
+        rotation = world_matrix[:3, :3]
+        if np.allclose(rotation @ rotation.T, np.eye(3), atol=1e-5):
+            # Rigid transform [R|t]: the inverse is [R^T | -R^T t], no general inversion needed
+            view = np.eye(4, dtype=world_matrix.dtype)
+            view[:3, :3] = rotation.T
+            view[:3, 3] = -(rotation.T @ world_matrix[:3, 3])
+        else:
+            # Scaled or sheared camera transform
+            view = np.linalg.inv(world_matrix)
+        view.flags.writeable = False
+
+        self._view_key = key
+        self._view_matrix = view
+        return view
 
     def get_projection_matrix(self) -> np.ndarray:
         """Get projection matrix."""
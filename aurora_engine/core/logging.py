@@ -49,6 +49,10 @@ class Logger:
         file_handler.setFormatter(file_formatter)
         self.logger.addHandler(file_handler)
 
+    def is_enabled_for(self, level: int) -> bool:
+        """Check if messages at the given level would be emitted."""
+        return self.logger.isEnabledFor(level)
+
     def debug(self, message: str, *args):
         """Log debug message."""
         self.logger.debug(message, *args)
@@ -9,6 +9,9 @@ class Component:
     Base class for all components.
     Components are pure data containers.
     """
+    # Subclasses that declare __slots__ get no per-instance __dict__;
+    # subclasses that don't keep working as before
+    __slots__ = ("entity", "enabled")
 
     def __init__(self):
         self.entity = None  # Back-reference to owner
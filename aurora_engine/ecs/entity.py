@@ -13,19 +13,33 @@ class Entity:
     """
 
     _next_id = 0
+    # Bumped whenever any entity's component set or active flag changes.
+    # The World compares against it to know when cached queries are stale.
+    _structure_version = 0
 
     def __init__(self):
         self.id = Entity._next_id
         Entity._next_id += 1
         self.components: Dict[Type[Component], Component] = {}
-        self.active = True
+        self._active = True
         # logger.debug(f"Entity {self.id} created") # Too verbose
 
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    @active.setter
+    def active(self, value: bool):
+        if value != self._active:
+            self._active = value
+            Entity._structure_version += 1
+
     def add_component(self, component: Component):
         """Attach a component."""
         component_type = type(component)
         self.components[component_type] = component
         component.entity = self
+        Entity._structure_version += 1
         # logger.debug(f"Added component {component_type.__name__} to Entity {self.id}")
         return component
 
@@ -43,4 +57,5 @@ class Entity:
         """Remove a component."""
         if component_type in self.components:
             del self.components[component_type]
+            Entity._structure_version += 1
             # logger.debug(f"Removed component {component_type.__name__} from Entity {self.id}")
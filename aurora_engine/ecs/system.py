@@ -27,3 +27,10 @@ class System(ABC):
     def update(self, entities: List, dt: float):
         """Process entities each frame."""
         pass
+
+    def on_entity_enter(self, entity):
+        """
+        Called once when an entity starts matching get_required_components().
+        Override to set up per-entity state on arrival instead of polling in update().
+        """
+        pass
@@ -1,6 +1,6 @@
 # aurora_engine/ecs/world.py
 
-from typing import List, Dict, Type
+from typing import List, Dict, Type, Tuple
 from aurora_engine.ecs.entity import Entity
 from aurora_engine.ecs.system import System
 from aurora_engine.ecs.component import Component
@@ -17,7 +17,10 @@ class World:
     def __init__(self):
         self.entities: List[Entity] = []
         self.systems: List[System] = []
-        self._component_cache: Dict[Type[Component], List[Entity]] = {}
+        # required components -> [structure version, entities]
+        self._component_cache: Dict[Tuple[Type[Component], ...], list] = {}
+        # Systems overriding on_entity_enter -> (query entry last diffed, entities seen in it)
+        self._entered: Dict[System, tuple] = {}
         self.logger = get_logger()
         
         # Systems that need to be notified of entity destruction
@@ -27,6 +30,7 @@ class World:
         """Create a new entity."""
         entity = Entity()
         self.entities.append(entity)
+        Entity._structure_version += 1
         # self.logger.debug(f"Created entity {entity.id}") # Too verbose for every entity
         return entity
 
@@ -66,7 +70,7 @@ class World:
             # This is crucial for Panda3D to remove the visual node
             from aurora_engine.rendering.mesh import MeshRenderer
             mesh_renderer = entity.get_component(MeshRenderer)
-            if mesh_renderer and hasattr(mesh_renderer, '_node_path') and mesh_renderer._node_path:
+            if mesh_renderer and mesh_renderer._node_path:
                 mesh_renderer._node_path.removeNode()
                 mesh_renderer._node_path = None
 
@@ -79,6 +83,8 @@ class World:
         """Register a system."""
         self.systems.append(system)
         self.systems.sort(key=lambda s: s.priority)
+        if type(system).on_entity_enter is not System.on_entity_enter:
+            self._entered[system] = (None, set())
         self.logger.info(f"Registered system {type(system).__name__} with priority {system.priority}")
 
     def update_systems(self, dt: float):
@@ -89,6 +95,9 @@ class World:
 
             try:
                 with profile_section(f"Sys:{type(system).__name__}"):
+                    if system in self._entered:
+                        self._dispatch_entity_enter(system)
+
                     # Get entities matching system's requirements
                     entities = self._get_entities_for_system(system)
                     system.update(entities, dt)
@@ -127,7 +136,26 @@ class World:
 
     def _get_entities_for_system(self, system: System) -> List[Entity]:
         """Find all entities with required components."""
-        required = system.get_required_components()
+        return self._query(tuple(system.get_required_components()))[1]
+
+    def _dispatch_entity_enter(self, system: System):
+        """Call on_entity_enter for entities that newly match the system's signature."""
+        entry = self._query(tuple(system.get_required_components()))
+        last_entry, previous = self._entered[system]
+        if entry is last_entry:
+            # Query unchanged since the last diff, nobody new can have arrived
+            return
+
+        self._entered[system] = (entry, set(entry[1]))
+        for entity in entry[1]:
+            if entity not in previous:
+                system.on_entity_enter(entity)
+
+    def _query(self, required: Tuple[Type[Component], ...]) -> list:
+        """Return the cached match for a component signature, rebuilding it if entities changed."""
+        entry = self._component_cache.get(required)
+        if entry is not None and entry[0] == Entity._structure_version:
+            return entry
 
         matching = []
         for entity in self.entities:
@@ -137,7 +165,9 @@ class World:
             if all(entity.has_component(comp_type) for comp_type in required):
                 matching.append(entity)
 
-        return matching
+        entry = [Entity._structure_version, matching]
+        self._component_cache[required] = entry
+        return entry
 
     def _invalidate_cache(self):
         """Clear component cache when entities change."""
@@ -1,269 +1,533 @@
 # aurora_engine/rendering/animation_system.py
 
 import os
-import sys
+import time
+import logging
+import tempfile
+from collections import deque
+from functools import lru_cache
+import numpy as np
+from concurrent.futures import Future, ThreadPoolExecutor
 from aurora_engine.ecs.system import System
 from aurora_engine.rendering.animator import Animator
 from aurora_engine.rendering.mesh import MeshRenderer
 from aurora_engine.core.logging import get_logger
 from aurora_engine.utils.resource import resolve_path
-from aurora_engine.utils.gltf_loader import load_gltf_fixed
+from aurora_engine.utils.gltf_loader import load_gltf_fixed, fix_gltf_file, is_gltf_path, read_gltf_bounds
 from direct.actor.Actor import Actor
-from panda3d.core import Point3, NodePath, ModelRoot, BoundingBox, Filename, Character, RenderModeAttrib, Texture
+from panda3d.core import NodePath, Filename, BoundingSphere, RenderState, ColorAttrib, CullFaceAttrib, TransparencyAttrib
 
 logger = get_logger()
 
+# Errors Panda3D and the GLTF fixer raise for bad or missing assets
+# (Actor raises KeyError when a model has no skeleton to bind clips to)
+_ACTOR_LOAD_ERRORS = (OSError, RuntimeError, ValueError, AssertionError, KeyError)
+
+# Smallest bounding-sphere diameter that guarantees a model is at least 0.1 units across
+_MIN_UNSCALED_DIAMETER = 0.1 * 3 ** 0.5
+
+# Base render state for every Actor: no shader/light overrides, single-sided, opaque,
+# flat white color at priority 1 to ensure it's white
+_ACTOR_BASE_STATE = RenderState.make(
+    CullFaceAttrib.make(CullFaceAttrib.MCullClockwise),
+    TransparencyAttrib.make(TransparencyAttrib.MNone),
+).addAttrib(ColorAttrib.makeFlat((1, 1, 1, 1)), 1)
+
+# Blend weight changes smaller than this (one 8-bit step) aren't sent to Panda3D
+_ALPHA_EPSILON = 1.0 / 256.0
+
+@lru_cache(maxsize=1024)
+def _panda_path(os_path: str) -> str:
+    """Convert an OS path to Panda3D's path syntax (memoized; fixed-file paths are deterministic)."""
+    return Filename.fromOsSpecific(os_path).getFullpath()
+
+class _BlendTable:
+    """
+    Blending animators stored as parallel arrays (SoA).
+    Timers advance with a single NumPy operation instead of per-animator attribute math.
+    """
+
+    def __init__(self, capacity: int = 16):
+        self.animators = []
+        self._slots = {} # Animator -> index into the arrays
+        self.timers = np.zeros(capacity, dtype=np.float32)
+        self.durations = np.zeros(capacity, dtype=np.float32)
+        # Reciprocal durations so per-frame weights are a multiply, not a divide
+        self.inv_durations = np.zeros(capacity, dtype=np.float32)
+        # Weight last sent to each Actor
+        self.last_alphas = np.zeros(capacity, dtype=np.float32)
+
+    def __len__(self):
+        return len(self.animators)
+
+    def add(self, animator):
+        """Register a blend for an animator, restarting it if already present."""
+        idx = self._slots.get(animator)
+        if idx is None:
+            idx = len(self.animators)
+            if idx == len(self.timers):
+                # Grow geometrically so bursts of new blends stay amortized O(1)
+                self.timers = np.concatenate((self.timers, np.zeros(idx, dtype=np.float32)))
+                self.durations = np.concatenate((self.durations, np.zeros(idx, dtype=np.float32)))
+                self.inv_durations = np.concatenate((self.inv_durations, np.zeros(idx, dtype=np.float32)))
+                self.last_alphas = np.concatenate((self.last_alphas, np.zeros(idx, dtype=np.float32)))
+            self._slots[animator] = idx
+            self.animators.append(animator)
+        self.timers[idx] = animator.blend_timer
+        self.durations[idx] = animator.blend_duration
+        # A zero-length blend completes on its first update, so its weight is never used
+        self.inv_durations[idx] = 1.0 / animator.blend_duration if animator.blend_duration > 0 else 0.0
+        # Animator.play() starts the new clip at weight 0
+        self.last_alphas[idx] = 0.0
+
+    def remove(self, indices):
+        """Drop the given slots and compact the arrays."""
+        count = len(self.animators)
+        keep = np.ones(count, dtype=bool)
+        keep[indices] = False
+        kept = np.flatnonzero(keep)
+        remaining = len(kept)
+        self.timers[:remaining] = self.timers[kept]
+        self.durations[:remaining] = self.durations[kept]
+        self.inv_durations[:remaining] = self.inv_durations[kept]
+        self.last_alphas[:remaining] = self.last_alphas[kept]
+        self.animators = [self.animators[i] for i in kept.tolist()]
+        self._slots = {animator: i for i, animator in enumerate(self.animators)}
+
 class AnimationSystem(System):
     """
     System to update Animator components and sync with Panda3D Actor.
     """
-    
+
+    # Queried by the World every frame; a shared tuple avoids a list allocation per call
+    _REQUIRED = (Animator, MeshRenderer)
+
     def __init__(self, backend):
         super().__init__()
         self.backend = backend
         self.priority = 100 # Run after logic, before rendering
-        self._temp_files = [] # Track temp files to delete later
+        self.init_budget_per_frame = 2 # Max Actors built per frame
+        self.init_time_budget = 0.004 # Soft per-frame time budget for Actor builds (seconds)
+        # Fixed GLTF copies are written here and removed together on shutdown
+        # (TemporaryDirectory's finalizer also removes them if on_destroy never runs)
+        self._temp_dir = tempfile.TemporaryDirectory(prefix="aurora_gltf_")
+        self._blending = _BlendTable() # Animators with a blend in progress
+        self._anim_sources_cache = {} # (model_path, clip signature) -> (clip sources, futures)
+        self._model_futures = {} # model_path -> Future of (template NodePath, panda path, pivot_offset, scale_factor)
+        self._anim_futures = {} # anim_path -> Future of the fixed file's panda path
+        # GLTF fixing and model loading run off the main thread, one task per file;
+        # only Actor construction and scene graph work stay on the main thread
+        self._loader_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="ActorLoader")
+        self._pending_loads = {} # Animator -> (MeshRenderer, model_path, model Future, anim sources, anim Futures)
+        self._bind_queue = deque() # (Animator, clip name) left to bind after the Actor was built
 
     def get_required_components(self):
-        return [Animator, MeshRenderer]
+        return self._REQUIRED
         
     def on_destroy(self):
-        """Cleanup temp files."""
-        for path in self._temp_files:
-            if os.path.exists(path):
-                try:
-                    os.remove(path)
-                except:
-                    pass
-        self._temp_files.clear()
+        """Stop background loads and cleanup temp files."""
+        self._loader_pool.shutdown(wait=True, cancel_futures=True)
+        self._pending_loads.clear()
+        self._bind_queue.clear()
+        # Drop cached templates before their backing files go away
+        for future in self._model_futures.values():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                future.result()[0].removeNode()
+        self._model_futures.clear()
+        self._anim_futures.clear()
+        self._anim_sources_cache.clear()
+        try:
+            self._temp_dir.cleanup()
+        except OSError as e:
+            logger.warning(f"Failed to remove temp directory {self._temp_dir.name}: {e}")
+
+    def on_entity_enter(self, entity):
+        """Start building an Actor as soon as an entity has both Animator and MeshRenderer."""
+        animator = entity.get_component(Animator)
+        # Only try to initialize once to avoid loop on failure
+        if animator._actor or animator._init_failed or animator in self._pending_loads:
+            return
+        self._request_actor(animator, entity.get_component(MeshRenderer))
 
     def update(self, entities, dt):
-        for entity in entities:
-            animator = entity.get_component(Animator)
-            mesh_renderer = entity.get_component(MeshRenderer)
-            
-            # Initialize Actor if needed
-            if not animator._actor and mesh_renderer._node_path:
-                # Only try to initialize once to avoid loop on failure
-                if not getattr(animator, '_init_failed', False):
-                    self._initialize_actor(animator, mesh_renderer)
-                
-            if not animator._actor:
+        # New entities are picked up by on_entity_enter; nothing here scales with idle animators
+        # Build Actors whose assets finished loading in the background
+        if self._pending_loads:
+            self._finish_pending_loads()
+
+        # Bind one remaining clip per frame instead of all of them at spawn
+        if self._bind_queue:
+            self._bind_next_queued()
+
+        # Handle Blending - only animators that are mid-blend need work each frame
+        if self._blending:
+            self._update_blends(dt)
+
+    def _update_blends(self, dt):
+        """Advance blend timers for animators registered in the blend table."""
+        table = self._blending
+        count = len(table)
+        timers = table.timers[:count]
+        durations = table.durations[:count]
+
+        # Advance every timer and compute every blend weight in one pass;
+        # the Python loop below only dispatches the precomputed scalars
+        timers += dt
+        done = (timers >= durations).tolist()
+        alphas = np.clip(timers * table.inv_durations[:count], 0.0, 1.0)
+        # Only weights that moved by a visible amount are dispatched
+        last_alphas = table.last_alphas[:count]
+        changed = np.abs(alphas - last_alphas) >= _ALPHA_EPSILON
+        last_alphas[changed] = alphas[changed]
+
+        blending = Animator.STATE_BLENDING
+        finished = []
+        append_finished = finished.append
+        skipped = []
+        in_view = self.backend.is_in_view
+        for idx, (animator, timer, is_done, alpha, is_changed) in enumerate(
+                zip(table.animators, timers.tolist(), done, alphas.tolist(), changed.tolist())):
+            actor = animator._actor
+            if animator._state != blending or not actor or animator.entity is None:
+                # Destroyed, or the blend was cancelled (e.g. stop())
+                append_finished(idx)
                 continue
+
+            next_clip = animator.next_clip
+            animator.blend_timer = timer
+            if is_done:
+                # Blend complete
+                prev_clip = animator.current_clip
+                animator.current_clip = next_clip
+                animator.next_clip = None
+                animator._state = Animator.STATE_PLAYING
                 
-            # Handle Blending
-            if animator.next_clip:
-                animator.blend_timer += dt
-                if animator.blend_timer >= animator.blend_duration:
-                    # Blend complete
-                    prev_clip = animator.current_clip
-                    animator.current_clip = animator.next_clip
-                    animator.next_clip = None
+                # Stop previous clip to save resources
+                if prev_clip:
+                    actor.stop(prev_clip)
                     
-                    # Stop previous clip to save resources
-                    if prev_clip:
-                        animator._actor.stop(prev_clip)
-                        
-                    animator._play_backend(animator.current_clip)
-                else:
-                    # Blending in progress
-                    alpha = animator.blend_timer / animator.blend_duration
-                    # Linear blend
-                    animator._actor.setControlEffect(animator.current_clip, 1.0 - alpha)
-                    animator._actor.setControlEffect(animator.next_clip, alpha)
-            
-            # Ensure playing state
-            if animator.playing and animator.current_clip and not animator.next_clip:
-                # Panda Actor manages this, but we might want to ensure loop is active
-                pass
+                animator._play_backend(next_clip)
+                append_finished(idx)
+            elif is_changed:
+                if not in_view(actor):
+                    # Off-screen actors skip the weight update; their timers keep running
+                    # so the blend still completes on time, and the weights catch up once visible.
+                    skipped.append(idx)
+                    continue
+                # Blending in progress - linear blend
+                set_effect = actor.setControlEffect
+                set_effect(animator.current_clip, 1.0 - alpha)
+                set_effect(next_clip, alpha)
 
-    def _initialize_actor(self, animator: Animator, mesh_renderer: MeshRenderer):
-        """Convert static model to Actor for animation."""
-        try:
-            model_path = mesh_renderer.model_path
-            if not model_path:
-                return
-            
-            model_path = resolve_path(model_path)
-            logger.info(f"Initializing Actor for {model_path}")
+        if skipped:
+            # Nothing was sent, so force a dispatch next frame
+            table.last_alphas[skipped] = -1.0
+        if finished:
+            table.remove(finished)
 
-            # 1. Load the main model using the fixed loader
-            panda_model_path = None
-            model_np = None
-            
-            try:
+    def _bind_next_queued(self):
+        """Bind the next queued clip whose Actor still exists."""
+        while self._bind_queue:
+            animator, name = self._bind_queue.popleft()
+            actor = animator._actor
+            if actor is None:
+                # Entity was destroyed before its clips were all bound
+                continue
+            # Clips played in the meantime are already bound, making this a lookup
+            if not actor.getAnimControl(name, allowAsyncBind=False):
+                logger.warning(f"Failed to bind animations: {name}")
+            elif logger.is_enabled_for(logging.DEBUG):
+                self._log_durations(actor, [name])
+            return
+
+    def _log_durations(self, actor, names):
+        """Debug-log the durations of bound clips, warning about empty ones."""
+        if not names:
+            return
+        # Walking every clip and formatting strings is only worth it when debugging
+        durations = [(anim_name, actor.getDuration(anim_name)) for anim_name in names]
+        logger.debug("--- Loaded Animations ---\n%s\n-------------------------",
+                     "\n".join(f"  - '{anim_name}': {duration:.4f}s" for anim_name, duration in durations))
+        zero = [anim_name for anim_name, duration in durations if duration <= 0.0]
+        if zero:
+            logger.warning(f"Animations with ZERO duration: {', '.join(zero)}")
+
+    def _compute_normalization(self, model_np, bounds=None):
+        """
+        Compute the pivot offset and auto-scale factor for a freshly loaded model.
+        bounds, if given, is a precomputed (min, max) box (e.g. from GLTF accessors).
+        """
+        if bounds is not None:
+            min_pt, max_pt = bounds
+        else:
+            # The cached bounding sphere is enough to tell that a model is normal-sized:
+            # its diameter bounds the largest AABB side from above, and (for a snug sphere)
+            # a diagonal of at least 0.1*sqrt(3) means some side is at least 0.1.
+            sphere = model_np.getBounds()
+            if not sphere.isEmpty() and not sphere.isInfinite() and isinstance(sphere, BoundingSphere):
+                diameter = sphere.getRadius() * 2.0
+                if _MIN_UNSCALED_DIAMETER <= diameter <= 10.0:
+                    return None, 1.0
+
+            # Scaling needed (or no usable sphere): walk the vertices for exact bounds
+            min_pt, max_pt = model_np.getTightBounds()
+        min_x, min_y, min_z = min_pt
+        max_x, max_y, max_z = max_pt
+        max_dim = max(max_x - min_x, max_y - min_y, max_z - min_z)
+        
+        # Center the model (Pivot at bottom center), as plain floats rather than a Point3
+        center_x = (min_x + max_x) / 2.0
+        center_y = (min_y + max_y) / 2.0
+        # Offset to bring bottom center to (0,0,0), only if significant
+        pivot_offset = None
+        if center_x * center_x + center_y * center_y + min_z * min_z > 0.1 * 0.1:
+            pivot_offset = (-center_x, -center_y, -min_z)
+
+        # Scale logic
+        scale_factor = 1.0
+        if max_dim > 10.0:
+            scale_factor = 2.0 / max_dim
+            logger.info(f"Auto-scaled massive Actor by {scale_factor:.4f}")
+        elif max_dim < 0.1 and max_dim > 0:
+            scale_factor = 2.0 / max_dim
+            logger.info(f"Auto-scaled tiny Actor by {scale_factor:.4f}")
+
+        return pivot_offset, scale_factor
+
+    def _get_anim_sources(self, model_path: str, clips):
+        """
+        Map clip names to where their animation comes from: None (the model file itself),
+        a native file path, or a Future for a GLTF file being fixed in the background.
+        Characters sharing a model and clip set reuse the same mapping, so the
+        resolve/fix work only happens for the first one.
+        Returns (sources, futures to wait for).
+        """
+        key = (model_path, frozenset(clips))
+        cached = self._anim_sources_cache.get(key)
+        if cached is not None:
+            return cached
+
+        sources = {}
+        model_abs = os.path.abspath(model_path)
+        # Clips often share a file; work out each distinct path only once
+        by_path = {}
+        for name, clip_path in clips:
+            if not clip_path:
+                sources[name] = None
+                continue
+
+            if clip_path in by_path:
+                sources[name] = by_path[clip_path]
+                continue
+
+            anim_path = resolve_path(clip_path)
+            if os.path.abspath(anim_path) == model_abs:
+                source = None
+            elif not is_gltf_path(anim_path):
+                source = _panda_path(anim_path)
+            else:
+                # One fix per file, shared by every model and clip set that uses it
+                source = self._anim_futures.get(anim_path)
+                if source is None:
+                    source = self._loader_pool.submit(self._fix_anim_file, anim_path)
+                    self._anim_futures[anim_path] = source
+            sources[name] = by_path[clip_path] = source
+
+        futures = [source for source in by_path.values() if isinstance(source, Future)]
+        cached = self._anim_sources_cache[key] = (sources, futures)
+        return cached
+
+    def _request_actor(self, animator: Animator, mesh_renderer: MeshRenderer):
+        """Queue background loading of the model and animation files for an Animator."""
+        model_path = mesh_renderer.model_path
+        if not model_path:
+            return
+
+        model_path = resolve_path(model_path)
+        logger.info(f"Initializing Actor for {model_path}")
+
+        # 1. Load the main model using the fixed loader (once per model)
+        model_future = self._model_futures.get(model_path)
+        if model_future is None:
+            model_future = self._loader_pool.submit(self._load_model_template, model_path)
+            self._model_futures[model_path] = model_future
+
+        # 2. Prepare animations (don't load yet); each file is fixed on its own worker
+        clips = tuple(zip(animator._clip_names, animator._clip_paths))
+        anim_sources, anim_futures = self._get_anim_sources(model_path, clips)
+
+        self._pending_loads[animator] = (mesh_renderer, model_path, model_future, anim_sources, anim_futures)
+
+    def _load_model_template(self, model_path: str):
+        """
+        Worker thread: load a model from disk, fixing GLTF files first.
+        Returns (NodePath, panda path, pivot_offset, scale_factor); the NodePath is never
+        attached to the scene graph. Auto-scale is measured here once per unique model,
+        since every Actor built from it has the same geometry.
+        """
+        panda_model_path = None
+        model_np = None
+        bounds = None
+        
+        try:
+            if is_gltf_path(model_path):
                 # Load the model first to verify it works and get the temp path
-                model_np, temp_model_path = load_gltf_fixed(self.backend.base.loader, model_path, keep_temp_file=True)
+                model_np, temp_model_path = load_gltf_fixed(self.backend.base.loader, model_path, keep_temp_file=True,
+                                                            cache_dir=self._temp_dir.name)
                 if temp_model_path:
-                    self._temp_files.append(temp_model_path)
-                    panda_model_path = Filename.fromOsSpecific(temp_model_path).getFullpath()
-                
-                logger.info(f"Model loaded successfully for actor creation.")
-                
-            except Exception as e:
-                logger.error(f"Failed to load model for Actor: {e}")
-                raise
-
-            # 2. Prepare animations (don't load yet)
-            anim_files = {}
-            for name, clip in animator.clips.items():
-                if clip.path:
-                    anim_path = resolve_path(clip.path)
-                    if os.path.abspath(anim_path) != os.path.abspath(model_path):
-                        try:
-                            _, temp_anim_path = load_gltf_fixed(self.backend.base.loader, anim_path, keep_temp_file=True)
-                            if temp_anim_path:
-                                self._temp_files.append(temp_anim_path)
-                                anim_files[name] = Filename.fromOsSpecific(temp_anim_path).getFullpath()
-                        except Exception as e:
-                            logger.warning(f"Failed to fix animation file '{name}' from {anim_path}: {e}")
-                    else:
-                        anim_files[name] = panda_model_path
-                else:
-                    anim_files[name] = panda_model_path
+                    panda_model_path = _panda_path(temp_model_path)
+                    # GLTF accessors carry min/max, so the bounds come without a vertex walk
+                    bounds = read_gltf_bounds(temp_model_path)
+            else:
+                # Native formats (egg/bam) don't need fixing
+                panda_model_path = _panda_path(model_path)
+                model_np = self.backend.base.loader.loadModel(panda_model_path)
+            
+            logger.debug("Model loaded successfully for actor creation.")
+            
+        except _ACTOR_LOAD_ERRORS as e:
+            logger.error("Failed to load model for Actor: %s", e)
+            raise
+
+        # Normalize Scale and Center (Same as Renderer)
+        pivot_offset, scale_factor = self._compute_normalization(model_np, bounds)
+
+        return model_np, panda_model_path, pivot_offset, scale_factor
+
+    def _fix_anim_file(self, anim_path: str) -> str:
+        """Worker thread: write the fixed copy of an animation file. Returns its panda path."""
+        try:
+            temp_anim_path = fix_gltf_file(anim_path, self._temp_dir.name)
+        except _ACTOR_LOAD_ERRORS as e:
+            logger.warning("Failed to fix animation file %s: %s", anim_path, e)
+            raise
+        return _panda_path(temp_anim_path)
+
+    def _collect_anim_files(self, anim_sources, panda_model_path: str):
+        """Turn resolved anim sources into the {clip name: panda path} dict Actor expects."""
+        anim_files = {}
+        for name, source in anim_sources.items():
+            if source is None:
+                anim_files[name] = panda_model_path
+            elif isinstance(source, str):
+                anim_files[name] = source
+            elif source.exception() is None:
+                anim_files[name] = source.result()
+            # Failed fixes were already reported by the worker; the clip is skipped
+        return anim_files
+
+    def _finish_pending_loads(self):
+        """
+        Build Actors on the main thread for background loads that have completed.
+        At most init_budget_per_frame Actors are built per frame, stopping early once
+        init_time_budget is spent, so a wave of spawns is spread over several frames.
+        """
+        deadline = time.perf_counter() + self.init_time_budget
+        built = 0
+        for animator, pending in list(self._pending_loads.items()):
+            if not (pending[2].done() and all(future.done() for future in pending[4])):
+                continue
+
+            if animator.entity is None:
+                # Entity was destroyed while its assets were loading
+                del self._pending_loads[animator]
+                continue
+
+            if built >= self.init_budget_per_frame or time.perf_counter() >= deadline:
+                break
+
+            del self._pending_loads[animator]
+            mesh_renderer, model_path, model_future, anim_sources, _ = pending
+            self._initialize_actor(animator, mesh_renderer, model_path, model_future, anim_sources)
+            built += 1
+
+    def _initialize_actor(self, animator: Animator, mesh_renderer: MeshRenderer,
+                          model_path: str, model_future, anim_sources):
+        """Convert static model to Actor for animation."""
+        panda_model_path = None
+        try:
+            model_np, panda_model_path, pivot_offset, scale_factor = model_future.result()
+            anim_files = self._collect_anim_files(anim_sources, panda_model_path)
 
             # 3. Create Actor
-            actor = Actor(model_np, anim_files)
+            # copy=True copies only the node hierarchy: the Geoms and their vertex data stay
+            # shared with the cached template. copy=False would hand the template itself to
+            # this Actor and leave nothing for the next character using the model.
+            actor = Actor(model_np, anim_files, copy=True, flattenable=True)
             
-            # 4. Pre-bind animations to prevent lag spikes
+            # 4. Bind the clips needed right away; the rest are queued and bound one per frame
             if anim_files:
-                logger.info("Pre-binding animations to prevent runtime lag...")
-                actor.bindAllAnims()
-                logger.info("Animations bound.")
-                
+                needed = [name for name in (animator.current_clip, animator.next_clip) if name in anim_files]
+                missing = [name for name in needed if not actor.getAnimControl(name, allowAsyncBind=False)]
+                if missing:
+                    logger.warning(f"Failed to bind animations: {', '.join(missing)}")
+                self._bind_queue.extend((animator, name) for name in anim_files if name not in needed)
+
                 # --- DEBUG: LIST LOADED ANIMATIONS ---
-                logger.info("--- Loaded Animations ---")
-                for anim_name in actor.getAnimNames():
-                    duration = actor.getDuration(anim_name)
-                    msg = f"  - '{anim_name}': {duration:.4f}s"
-                    logger.info(msg)
-                    if duration <= 0.0:
-                        logger.warning(f"    WARNING: Animation '{anim_name}' has ZERO duration!")
-                logger.info("-------------------------")
+                # Only the clips bound so far; queued clips are listed as they are bound
+                if logger.is_enabled_for(logging.DEBUG):
+                    self._log_durations(actor, [name for name in needed if name not in missing])
             
-            # 5. Fix Hierarchy & Visibility
-            actor.reparentTo(self.backend.scene_graph)
+            # 5. Remove any problematic overrides. Let the main renderer/shader handle it.
+            # One state swap replaces the clearShader/clearLight/setTwoSided/setTransparency/setColor chain.
+            # The Actor stays detached until the end so these changes don't invalidate live scene state.
+            actor.setState(_ACTOR_BASE_STATE)
             
             # 6. Hide Debug Geometry (Colliders)
-            collider_patterns = ["**/*Collider*", "**/*collider*", "**/*COLLIDER*"]
-            for pattern in collider_patterns:
-                nodes = actor.findAllMatches(pattern)
-                for node in nodes:
+            # One tree walk with a case-insensitive name check instead of a walk per spelling
+            for node in actor.findAllMatches("**"):
+                if "collider" in node.getName().lower():
                     node.hide()
 
             # 7. Normalize Scale and Center (Same as Renderer)
             # This is critical because Renderer's logic doesn't run on Actor created here
-            min_pt, max_pt = actor.getTightBounds()
-            size = max_pt - min_pt
-            max_dim = max(size.getX(), size.getY(), size.getZ())
-            
-            # Center the model (Pivot at bottom center)
-            bottom_center = Point3((min_pt.getX() + max_pt.getX()) / 2.0,
-                                   (min_pt.getY() + max_pt.getY()) / 2.0,
-                                   min_pt.getZ())
+            # The pivot and scale were measured on the cached model when it was loaded.
+            # The pivot offset is only computed (and used) when the model needs rescaling.
             
-            # Offset to bring bottom center to (0,0,0)
-            if bottom_center.length() > 0.1:
-                # For Actor, we can't just setPos on the actor itself if we want to bake it,
-                # but we can setPos on the GeomNode or use flattenLight if it doesn't break animations.
-                # Flattening Actor usually breaks animations.
-                # Instead, we should apply a counter-transform to the joints or a child node.
-                # Or simpler: Just set the position offset on the Actor, and let the Entity transform apply on top.
-                # BUT Renderer applies Entity transform to mesh_renderer._node_path (which is the Actor).
-                # So if we setPos here, it will be overwritten by Renderer.
-                # We need to wrap the Actor in a container node?
-                # Or modify the Actor's internal geometry.
-                # Actor.getChild(0).setPos(-bottom_center)?
-                
-                # Let's try wrapping it.
-                # But mesh_renderer._node_path expects to be the root.
-                
-                # Actually, Renderer uses setPos/setQuat/setScale on _node_path.
-                # If we want an offset, we need a child.
-                # But _node_path IS the Actor.
-                
-                # Alternative: Modify the joints? Too complex.
-                # Let's try to find the GeomNode and move it.
-                # actor.getGeomNode().setPos(-bottom_center)
-                pass
-
-            # Scale logic
-            scale_factor = 1.0
-            if max_dim > 10.0:
-                scale_factor = 2.0 / max_dim
-                logger.info(f"Auto-scaled massive Actor by {scale_factor:.4f}")
-            elif max_dim < 0.1 and max_dim > 0:
-                scale_factor = 2.0 / max_dim
-                logger.info(f"Auto-scaled tiny Actor by {scale_factor:.4f}")
-                
             if scale_factor != 1.0:
+                # Renderer overwrites the node's scale with the Entity scale every frame,
+                # and an Actor can't be flattened, so the auto-scale would be lost.
+                # Use a container node: Renderer moves the container, the Actor keeps
+                # the offset/scale as a child.
+                root = NodePath("ActorContainer")
+                actor.reparentTo(root)
+                if pivot_offset:
+                    actor.setPos(*pivot_offset)
                 actor.setScale(scale_factor)
-                # We can't flatten Actor. So we just leave the scale.
-                # Renderer will overwrite scale?
-                # Renderer: self.backend.update_mesh_transform(mesh_renderer._node_path, pos, rot, scale)
-                # Renderer applies Entity scale.
-                # If we set scale here, Renderer will overwrite it with Entity scale (usually 1,1,1).
-                # So the auto-scale is lost!
-                
-                # Solution: We need to bake the scale into the model BEFORE creating Actor?
-                # Or use a container node.
-                
-                # Let's use a container node.
-                container = NodePath("ActorContainer")
-                container.reparentTo(self.backend.scene_graph)
-                actor.reparentTo(container)
-                
-                # Apply offset/scale to Actor (child of container)
-                if bottom_center.length() > 0.1:
-                    actor.setPos(-bottom_center)
-                actor.setScale(scale_factor)
-                
-                # Set _node_path to container
-                # But wait, Animator needs _actor to control animations.
-                # Animator._actor is already set to actor.
-                # MeshRenderer._node_path should be the container so Renderer moves the container.
-                
-                # 8. Replace static mesh node
-                if mesh_renderer._node_path:
-                    mesh_renderer._node_path.removeNode()
-                
-                mesh_renderer._node_path = container
-                animator._actor = actor # Keep reference to actual actor for control
-                
-                # Ensure visibility
-                container.show()
-                actor.show()
-                
                 logger.info("Wrapped Actor in container for normalization.")
             else:
                 # No scaling needed
-                if mesh_renderer._node_path:
-                    mesh_renderer._node_path.removeNode()
-                mesh_renderer._node_path = actor
-                animator._actor = actor
-                actor.show()
-
-            # Remove any problematic overrides. Let the main renderer/shader handle it.
-            actor.clearShader()
-            actor.clearLight()
-            actor.setTwoSided(False) # Most models are not two-sided
-            actor.setTransparency(False)
-            actor.setColor(1, 1, 1, 1, 1) # Priority 1 to ensure it's white
-            
+                root = actor
+
+            # 8. Replace static mesh node
+            if mesh_renderer._node_path:
+                mesh_renderer._node_path.removeNode()
+            mesh_renderer._node_path = root
+            animator._actor = actor # Keep reference to actual actor for control
+
+            # Ensure visibility, then fix hierarchy: attach once everything is set up
+            actor.show()
+            root.reparentTo(self.backend.scene_graph)
+
+            # Let Animator.play() register new blends with this system
+            animator._blend_table = self._blending
+            if animator._state == Animator.STATE_BLENDING:
+                self._blending.add(animator)
+
             # 9. Start default animation
             if animator.current_clip and animator.current_clip in anim_files:
                  logger.info(f"Starting animation: {animator.current_clip}")
                  try:
                      animator._play_backend(animator.current_clip)
-                 except Exception as e:
-                     logger.error(f"Failed to play animation {animator.current_clip}: {e}")
+                 except _ACTOR_LOAD_ERRORS as e:
+                     logger.error("Failed to play animation %s: %s", animator.current_clip, e)
             else:
                 logger.info("No default animation playing (Bind Pose).")
                 
             logger.info(f"Actor initialized successfully.")
 
-        except Exception as e:
-            logger.error(f"Failed to initialize Actor: {e}", exc_info=True)
+        except _ACTOR_LOAD_ERRORS as e:
+            logger.error("Failed to initialize Actor: %s", e, exc_info=True)
             animator._init_failed = True
             
             # Fallback: Ensure static model is visible if Actor failed
@@ -275,5 +539,5 @@ class AnimationSystem(System):
                      mesh_renderer._node_path.reparentTo(self.backend.scene_graph)
                      mesh_renderer._node_path.show()
                      logger.info("Reverted to static model due to animation failure.")
-                 except Exception as fallback_e:
-                     logger.error(f"Fallback failed: {fallback_e}")
+                 except _ACTOR_LOAD_ERRORS as fallback_e:
+                     logger.error("Fallback failed: %s", fallback_e)
@@ -3,6 +3,7 @@
 from aurora_engine.ecs.component import Component
 from aurora_engine.core.logging import get_logger
 from typing import Dict, Optional, List
+from array import array
 
 logger = get_logger()
 
@@ -10,6 +11,8 @@ class AnimationClip:
     """
     Represents a single animation clip (e.g., 'Walk', 'Idle').
     """
+    __slots__ = ("name", "path", "speed", "loop", "_backend_handle")
+
     def __init__(self, name: str, path: str = None, speed: float = 1.0, loop: bool = True):
         self.name = name
         self.path = path # Path to animation file if separate, or name in GLTF
@@ -22,30 +25,92 @@ class Animator(Component):
     """
     Component for handling skeletal character animations.
     """
+    __slots__ = (
+        "_clip_index", "_clip_names", "_clip_paths", "_clip_speeds", "_clip_loops",
+        "current_clip", "next_clip", "blend_duration", "blend_timer", "_state",
+        "_actor", "_init_failed", "_blend_table",
+    )
+
+    # Playback state, kept in one int so per-frame checks are a single attribute load
+    STATE_IDLE = 0
+    STATE_PLAYING = 1
+    STATE_BLENDING = 2
+
     def __init__(self):
         super().__init__()
-        self.clips: Dict[str, AnimationClip] = {}
+        # Clips stored as parallel arrays (SoA) indexed through _clip_index
+        self._clip_index: Dict[str, int] = {}
+        self._clip_names: List[str] = []
+        self._clip_paths: List[Optional[str]] = []
+        self._clip_speeds = array('f')
+        self._clip_loops = bytearray()
         self.current_clip: Optional[str] = None
         self.next_clip: Optional[str] = None
         self.blend_duration: float = 0.2
         self.blend_timer: float = 0.0
-        self.playing = False
+        self._state = Animator.STATE_IDLE
         
         # Backend reference (Panda3D Actor)
         self._actor = None
+        # Set by the AnimationSystem if Actor creation fails, so it isn't retried
+        self._init_failed = False
+        # Blend table owned by the AnimationSystem (assigned on Actor init)
+        self._blend_table = None
+
+    @property
+    def playing(self) -> bool:
+        """Whether a clip is playing or being blended to."""
+        return self._state != Animator.STATE_IDLE
+
+    @playing.setter
+    def playing(self, value: bool):
+        if not value:
+            self._state = Animator.STATE_IDLE
+        elif self._state == Animator.STATE_IDLE:
+            self._state = Animator.STATE_PLAYING
+
+    @property
+    def clips(self) -> Dict[str, AnimationClip]:
+        """Registered clips as AnimationClip objects (built on access)."""
+        return {
+            name: AnimationClip(name, path, speed, bool(loop))
+            for name, path, speed, loop in zip(self._clip_names, self._clip_paths, self._clip_speeds, self._clip_loops)
+        }
+
+    @clips.setter
+    def clips(self, clips: Dict[str, AnimationClip]):
+        self._clip_index = {}
+        self._clip_names = []
+        self._clip_paths = []
+        self._clip_speeds = array('f')
+        self._clip_loops = bytearray()
+        for clip in clips.values():
+            self.add_clip(clip.name, clip.path, clip.speed, clip.loop)
 
     def add_clip(self, name: str, path: str = None, speed: float = 1.0, loop: bool = True):
         """Register an animation clip."""
-        self.clips[name] = AnimationClip(name, path, speed, loop)
+        idx = self._clip_index.get(name)
+        if idx is None:
+            self._clip_index[name] = len(self._clip_names)
+            self._clip_names.append(name)
+            self._clip_paths.append(path)
+            self._clip_speeds.append(speed)
+            self._clip_loops.append(1 if loop else 0)
+        else:
+            # Re-registering a name replaces the clip, as with the old dict
+            self._clip_paths[idx] = path
+            self._clip_speeds[idx] = speed
+            self._clip_loops[idx] = 1 if loop else 0
 
     def play(self, name: str, blend: float = 0.2, force: bool = False):
         """Play an animation, optionally blending."""
-        if name not in self.clips:
-            logger.warning(f"Animation clip '{name}' not found.")
+        # Hot path for state machines: already playing this clip fully, nothing to do
+        if name == self.current_clip and self.next_clip is None and not force:
             return
 
-        # If we are already playing this clip fully, do nothing
-        if self.current_clip == name and self.next_clip is None and not force:
+        idx = self._clip_index.get(name)
+        if idx is None:
+            logger.warning(f"Animation clip '{name}' not found.")
             return
             
         # If we are already blending TO this clip, do nothing (don't reset timer!)
@@ -53,40 +118,78 @@ class Animator(Component):
             return
 
         if self.current_clip is None:
-            # Immediate play
-            self.current_clip = name
-            self.blend_timer = 0.0
-            self._play_backend(name)
+            self._play_immediate(name, idx)
         else:
-            # Blend
-            self.next_clip = name
-            self.blend_duration = blend
-            self.blend_timer = 0.0
-            # Backend blending logic handled in system
-            if self._actor:
-                self._actor.enableBlend()
-                # Start the new animation but with 0 weight initially
-                # We need to make sure it's playing so we can blend to it
-                clip = self.clips[self.next_clip]
-                self._actor.setPlayRate(clip.speed, self.next_clip)
-                if clip.loop:
-                    self._actor.loop(self.next_clip)
-                else:
-                    self._actor.play(self.next_clip)
-                    
-                self._actor.setControlEffect(self.current_clip, 1.0)
-                self._actor.setControlEffect(self.next_clip, 0.0)
-            
-        self.playing = True
+            self._play_blend(name, idx, blend)
+
+    def play_immediate(self, name: str):
+        """Switch to a clip at full weight right away, cancelling any blend in progress."""
+        idx = self._clip_index.get(name)
+        if idx is None:
+            logger.warning(f"Animation clip '{name}' not found.")
+            return
+        self._play_immediate(name, idx)
+
+    def play_blend(self, name: str, blend: float = 0.2):
+        """Blend from the current clip to another over `blend` seconds."""
+        idx = self._clip_index.get(name)
+        if idx is None:
+            logger.warning(f"Animation clip '{name}' not found.")
+            return
+        if self.current_clip is None:
+            # Nothing to blend from
+            self._play_immediate(name, idx)
+        else:
+            self._play_blend(name, idx, blend)
+
+    def _play_immediate(self, name: str, idx: int):
+        self.current_clip = name
+        self.next_clip = None
+        self.blend_timer = 0.0
+        self._state = Animator.STATE_PLAYING
+        self._play_backend(name, idx)
+
+    def _play_blend(self, name: str, idx: int, blend: float):
+        self.next_clip = name
+        self.blend_duration = blend
+        self.blend_timer = 0.0
+        self._state = Animator.STATE_BLENDING
+        # Backend blending logic handled in system
+        if self._blend_table is not None:
+            self._blend_table.add(self)
+        if self._actor:
+            self._actor.enableBlend()
+            # Start the new animation but with 0 weight initially
+            # We need to make sure it's playing so we can blend to it
+            self._actor.setPlayRate(self._clip_speeds[idx], name)
+            if self._clip_loops[idx]:
+                self._actor.loop(name)
+            else:
+                self._actor.play(name)
+                
+            self._actor.setControlEffect(self.current_clip, 1.0)
+            self._actor.setControlEffect(name, 0.0)
 
     def stop(self):
         """Stop current animation."""
-        self.playing = False
+        # Also cancels any blend in progress
+        self._state = Animator.STATE_IDLE
         self.current_clip = None
+        self.next_clip = None
         if self._actor:
             self._actor.stop()
 
-    def _play_backend(self, name: str):
+    def on_destroy(self):
+        """Release the Actor's animation controls when the entity is destroyed."""
+        # MeshRenderer only removes the container node when the Actor was wrapped for scaling,
+        # so the Actor's part bundles and anim controls are freed here
+        if self._actor is not None:
+            self._actor.cleanup()
+            self._actor = None
+        self._blend_table = None
+        self._state = Animator.STATE_IDLE
+
+    def _play_backend(self, name: str, idx: int = None):
         """Internal: Trigger backend playback."""
         if not self._actor:
             return
@@ -94,10 +197,11 @@ class Animator(Component):
         # Ensure we exit blend mode when playing a single animation
         self._actor.disableBlend()
             
-        clip = self.clips[name]
-        self._actor.setPlayRate(clip.speed, name)
+        if idx is None:
+            idx = self._clip_index[name]
+        self._actor.setPlayRate(self._clip_speeds[idx], name)
         
-        if clip.loop:
+        if self._clip_loops[idx]:
             self._actor.loop(name)
         else:
             self._actor.play(name)
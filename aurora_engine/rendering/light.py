@@ -12,9 +12,15 @@ class Light(Component):
         super().__init__()
         self.color: np.ndarray = np.array([1.0, 1.0, 1.0], dtype=np.float32)
         self.intensity: float = 1.0
+        # Sync with the backend every N frames (1 = every frame, 0 = only once at creation).
+        # Static or distant lights can use a larger interval; see LightSystem.set_update_rate.
+        self.update_interval: int = 1
         
         # Backend handle (e.g., Panda3D Light NodePath)
         self._backend_handle = None
+        # Last attenuation pushed to the backend, so unchanged lights skip the Panda3D call
+        # (color and transform are tracked by the LightSystem)
+        self._last_attenuation = None
 
 class AmbientLight(Light):
     """
@@ -1,6 +1,7 @@
 # aurora_engine/rendering/light_system.py
 
 from typing import List, Type
+import numpy as np
 from aurora_engine.ecs.system import System
 from aurora_engine.ecs.component import Component
 from aurora_engine.scene.transform import Transform
@@ -9,7 +10,7 @@ from aurora_engine.core.logging import get_logger
 from panda3d.core import AmbientLight as PandaAmbientLight
 from panda3d.core import DirectionalLight as PandaDirectionalLight
 from panda3d.core import PointLight as PandaPointLight
-from panda3d.core import Vec4, NodePath, BitMask32
+from panda3d.core import Vec3, Vec4, Quat, NodePath, BitMask32
 
 logger = get_logger()
 
@@ -23,64 +24,136 @@ class LightSystem(System):
         self.renderer = renderer
         self.priority = 90 # Run before rendering
         self._debug_log_timer = 0.0
-        self._initialized_lights = set()
+        # Initialized lights as (entity, light, transform, update handler, light NodePath, Panda light),
+        # built once on arrival so the per-frame loop needs no component lookups
+        self._active = []
+        # Premultiplied RGBA last pushed to each active light, row-aligned with _active (SoA)
+        self._applied_colors = np.full((16, 4), np.nan, dtype=np.float32)
+        # World position + rotation quaternion last pushed to each light's node, same rows
+        self._applied_poses = np.full((16, 7), np.nan, dtype=np.float32)
+        self._frame_count = 0
+        # Scratch values reused for every push; Panda3D copies them, so no per-light allocations
+        self._scratch_color = Vec4()
+        self._scratch_pos = Vec3()
+        self._scratch_quat = Quat()
+        # Per-type handlers: one dict lookup per light instead of an isinstance chain
+        self._init_handlers = {
+            AmbientLight: self._init_ambient,
+            DirectionalLight: self._init_directional,
+            PointLight: self._init_point,
+        }
+        self._update_handlers = {
+            AmbientLight: None,
+            DirectionalLight: self._update_directional,
+            PointLight: self._update_point,
+        }
+
+    # Frame rate assumed when converting an update rate in Hz to a frame interval
+    target_fps = 60
 
     def get_required_components(self) -> List[Type[Component]]:
         return [Light]
 
+    def set_update_rate(self, light: Light, hz: float):
+        """Sync a light with the backend at roughly `hz` times per second (<= 0: never after creation)."""
+        light.update_interval = max(1, round(self.target_fps / hz)) if hz > 0 else 0
+
     def update(self, entities: List, dt: float):
         self._debug_log_timer += dt
         should_log = self._debug_log_timer > 5.0 # Log every 5 seconds
         if should_log:
             self._debug_log_timer = 0.0
+        frame = self._frame_count
+        self._frame_count += 1
         
-        for entity in entities:
-            light = entity.get_component(Light)
-            
-            # Initialize backend light if needed
-            if entity.id not in self._initialized_lights:
-                self._initialize_light(entity, light)
-                self._initialized_lights.add(entity.id)
-                
-            if light._backend_handle:
-                self._update_light(entity, light, should_log)
+        destroyed = False
+        due = []
+        for idx, entry in enumerate(self._active):
+            entity, light = entry[0], entry[1]
+            if light.entity is None:
+                # Entity was destroyed; dropped below
+                destroyed = True
+                continue
+            # Lights with a longer interval update in buckets, staggered by entity id
+            interval = light.update_interval
+            if interval != 1 and (interval == 0 or (frame - entity.id) % interval):
+                continue
+            due.append(idx)
+
+        if due:
+            self._sync_lights(due, should_log)
+
+        if destroyed:
+            keep = [light.entity is not None for _, light, *_ in self._active]
+            for entry, kept in zip(self._active, keep):
+                if not kept:
+                    self._release_light(entry[1])
+            self._active = [entry for entry, kept in zip(self._active, keep) if kept]
+            self._compact_colors(keep)
+
+    def on_entity_enter(self, entity):
+        """Create the backend light for a new Light entity and sync it once."""
+        light = entity.get_component(Light)
+        if light._backend_handle:
+            return
+        self._initialize_light(entity, light)
+        if light._backend_handle:
+            light_np = light._backend_handle
+            entry = (entity, light, entity.get_component(Transform),
+                     self._handler_for(self._update_handlers, type(light)), light_np, light_np.node())
+            idx = len(self._active)
+            self._active.append(entry)
+            if idx == len(self._applied_colors):
+                # Grow by doubling
+                self._applied_colors = np.concatenate(
+                    (self._applied_colors, np.full((idx, 4), np.nan, dtype=np.float32)))
+                self._applied_poses = np.concatenate(
+                    (self._applied_poses, np.full((idx, 7), np.nan, dtype=np.float32)))
+            # NaN never compares equal, so the first sync always pushes color and pose
+            self._applied_colors[idx] = np.nan
+            self._applied_poses[idx] = np.nan
+            self._sync_lights([idx])
 
     def on_entity_removed(self, entity):
         """Clean up light when entity is removed."""
         light = entity.get_component(Light)
-        if light and light._backend_handle:
+        if light:
+            self._release_light(light)
+            keep = [entry[1] is not light for entry in self._active]
+            self._active = [entry for entry, kept in zip(self._active, keep) if kept]
+            self._compact_colors(keep)
+
+    def _compact_colors(self, keep: List[bool]):
+        """Drop color and pose rows of removed lights so rows stay aligned with _active."""
+        kept = np.flatnonzero(keep)
+        self._applied_colors[:len(kept)] = self._applied_colors[kept]
+        self._applied_poses[:len(kept)] = self._applied_poses[kept]
+
+    def _release_light(self, light: Light):
+        """Remove a light's backend node."""
+        if light._backend_handle:
             # The light is already cleared from scene graph, just remove the node
             if hasattr(self.renderer.backend, 'scene_graph'):
                 self.renderer.backend.scene_graph.clearLight(light._backend_handle)
             light._backend_handle.removeNode()
             light._backend_handle = None
-        if entity.id in self._initialized_lights:
-            self._initialized_lights.remove(entity.id)
+
+    def _handler_for(self, handlers: dict, light_type: type):
+        """Look up a per-type handler; subclasses resolve through the MRO once and are cached."""
+        try:
+            return handlers[light_type]
+        except KeyError:
+            handler = next((handlers[base] for base in light_type.__mro__ if base in handlers), None)
+            handlers[light_type] = handler
+            return handler
 
     def _initialize_light(self, entity, light: Light):
         """Create the Panda3D light object."""
-        panda_light = None
         name = f"Light_{entity.id}"
-        
-        if isinstance(light, AmbientLight):
-            panda_light = PandaAmbientLight(name)
-            
-        elif isinstance(light, DirectionalLight):
-            panda_light = PandaDirectionalLight(name)
-            if light.cast_shadows:
-                panda_light.setShadowCaster(True, light.shadow_map_size, light.shadow_map_size)
-                lens = panda_light.getLens()
-                # Ensure film size is large enough to cover the view
-                lens.setFilmSize(light.shadow_film_size, light.shadow_film_size)
-                lens.setNearFar(*light.shadow_near_far)
-                
-                # Visualize Shadow Volume (Enabled for debugging)
-                # panda_light.showFrustum()
-                logger.info(f"  -> Shadows Enabled: Map={light.shadow_map_size}, Film={light.shadow_film_size}")
-                
-        elif isinstance(light, PointLight):
-            panda_light = PandaPointLight(name)
-            panda_light.setAttenuation(light.attenuation)
+        # A new Panda3D light starts from defaults; forget anything pushed to a previous one
+        light._last_attenuation = None
+        create = self._handler_for(self._init_handlers, type(light))
+        panda_light = create(name, light) if create else None
             
         if panda_light:
             # Attach to scene graph
@@ -88,48 +161,98 @@ class LightSystem(System):
             self.renderer.backend.scene_graph.setLight(light_np)
             light._backend_handle = light_np
             
-            # Force Shadow Bitmasks
-            if isinstance(light, DirectionalLight) and light.cast_shadows:
-                # Ensure everything is visible to the shadow camera
-                # BitMask32.allOn() might be too aggressive if we use masks, but good for debugging
-                panda_light.setCameraMask(BitMask32.allOn())
-            
             logger.info(f"Initialized light: {name} ({type(light).__name__})")
 
-    def _update_light(self, entity, light: Light, log_debug: bool = False):
-        """Update light properties."""
-        light_np = light._backend_handle
-        panda_light = light_np.node()
-        
-        # Update Color
-        color = Vec4(light.color[0], light.color[1], light.color[2], 1.0) * light.intensity
-        panda_light.setColor(color)
-        
-        if log_debug:
-            logger.info(f"Light {entity.id} Color: {color}")
-        
-        # Update Transform (if not Ambient)
-        if not isinstance(light, AmbientLight):
-            transform = entity.get_component(Transform)
-            if transform:
-                pos = transform.get_world_position()
-                rot = transform.get_world_rotation()
-                
-                # Update position
-                light_np.setPos(pos[0], pos[1], pos[2])
-                
-                # Update rotation (Panda uses HPR or Quat)
-                from panda3d.core import Quat
-                light_np.setQuat(Quat(rot[3], rot[0], rot[1], rot[2]))
-                
-        # Update specific properties
-        if isinstance(light, PointLight):
-            panda_light.setAttenuation(light.attenuation)
+    def _init_ambient(self, name: str, light: AmbientLight):
+        return PandaAmbientLight(name)
+
+    def _init_directional(self, name: str, light: DirectionalLight):
+        panda_light = PandaDirectionalLight(name)
+        if light.cast_shadows:
+            panda_light.setShadowCaster(True, light.shadow_map_size, light.shadow_map_size)
+            lens = panda_light.getLens()
+            # Ensure film size is large enough to cover the view
+            lens.setFilmSize(light.shadow_film_size, light.shadow_film_size)
+            lens.setNearFar(*light.shadow_near_far)
             
+            # Visualize Shadow Volume (Enabled for debugging)
+            # panda_light.showFrustum()
+            logger.info(f"  -> Shadows Enabled: Map={light.shadow_map_size}, Film={light.shadow_film_size}")
+
+            # Force Shadow Bitmasks
+            # Ensure everything is visible to the shadow camera
+            # BitMask32.allOn() might be too aggressive if we use masks, but good for debugging
+            panda_light.setCameraMask(BitMask32.allOn())
+        return panda_light
+
+    def _init_point(self, name: str, light: PointLight):
+        panda_light = PandaPointLight(name)
+        panda_light.setAttenuation(light.attenuation)
+        return panda_light
+
+    def _sync_lights(self, indices: List[int], log_debug: bool = False):
+        """Update light properties for the given rows of _active."""
+        active = self._active
+        lights = [active[idx][1] for idx in indices]
+
+        # Premultiply color by intensity for every light at once (alpha = intensity, as before)
+        colors = np.ones((len(lights), 4), dtype=np.float32)
+        colors[:, :3] = [light.color[:3] for light in lights]
+        colors *= np.fromiter((light.intensity for light in lights), dtype=np.float32, count=len(lights))[:, None]
+        # Only lights whose color or intensity changed are pushed to Panda3D
+        changed = (colors != self._applied_colors[indices]).any(axis=1)
+        self._applied_colors[indices] = colors
+
+        scratch_color = self._scratch_color
+        for idx, color, is_changed in zip(indices, colors.tolist(), changed.tolist()):
+            entity, light, _, update, _, panda_light = active[idx]
+            if is_changed:
+                scratch_color.set(*color)
+                panda_light.setColor(scratch_color)
+            if log_debug:
+                logger.info(f"Light {entity.id} Color: {Vec4(*color)}")
+
+            # Type-specific updates (Ambient has none)
+            if update:
+                update(light, panda_light)
+
+        # Positional lights (those with an update handler) follow their entity Transform
+        posed = [idx for idx in indices if active[idx][3] and active[idx][2]]
+        if posed:
+            self._sync_poses(posed)
+
+    def _sync_poses(self, indices: List[int]):
+        """Push world position/rotation of the given rows to their light nodes."""
+        active = self._active
+        transforms = [active[idx][2] for idx in indices]
+        # Gather every pose into one block, then compare against what was last pushed in bulk
+        poses = np.empty((len(indices), 7), dtype=np.float32)
+        poses[:, :3] = [transform.get_world_position() for transform in transforms]
+        poses[:, 3:] = [transform.get_world_rotation() for transform in transforms]
+        applied = self._applied_poses[indices]
+        changed = (poses != applied).any(axis=1)
+        self._applied_poses[indices] = poses
+
+        pos, quat = self._scratch_pos, self._scratch_quat
+        for row in np.flatnonzero(changed).tolist():
+            x, y, z, qx, qy, qz, qw = poses[row].tolist()
+            pos.set(x, y, z)
+            # Panda quaternions are w first
+            quat.set(qw, qx, qy, qz)
+            # One call for both instead of setPos + setQuat
+            active[indices[row]][4].setPosQuat(pos, quat)
+
+    def _update_directional(self, light: DirectionalLight, panda_light):
         # Update shadow properties dynamically if needed
-        if isinstance(light, DirectionalLight) and light.cast_shadows:
+        if light.cast_shadows:
              lens = panda_light.getLens()
              if lens.getFilmSize().getX() != light.shadow_film_size:
                  lens.setFilmSize(light.shadow_film_size, light.shadow_film_size)
              if lens.getNear() != light.shadow_near_far[0] or lens.getFar() != light.shadow_near_far[1]:
                  lens.setNearFar(*light.shadow_near_far)
+
+    def _update_point(self, light: PointLight, panda_light):
+        attenuation = tuple(light.attenuation)
+        if attenuation != light._last_attenuation:
+            panda_light.setAttenuation(attenuation)
+            light._last_attenuation = attenuation
@@ -1,6 +1,6 @@
 # aurora_engine/rendering/material.py
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from aurora_engine.rendering.shader import Shader
 from panda3d.core import RenderState, ColorBlendAttrib, CullFaceAttrib
 from aurora_engine.core.logging import get_logger
@@ -9,6 +9,7 @@ logger = get_logger()
 
 class MaterialProperty:
     """A single material property (color, texture, float, etc.)."""
+    __slots__ = ("name", "value")
 
     def __init__(self, name: str, value: Any):
         self.name = name
@@ -21,6 +22,9 @@ class Material:
     Contains shader reference and property values.
     """
 
+    # (cull_mode, blend_mode, depth_write) -> RenderState shared by every material with that combination
+    _STATE_CACHE: Dict[Tuple[str, str, bool], RenderState] = {}
+
     def __init__(self, name: str, shader: Shader):
         self.name = name
         self.shader = shader
@@ -53,6 +57,11 @@ class Material:
         if not node_path:
             return
 
+        # Apply render state first: setState replaces the node's whole state,
+        # including the shader and inputs set below
+        state = self._create_render_state()
+        node_path.setState(state)
+
         # Apply shader
         self.shader.bind(node_path)
 
@@ -60,12 +69,17 @@ class Material:
         for prop in self.properties.values():
             # TODO: Handle different types (textures, colors, etc.)
             node_path.setShaderInput(prop.name, prop.value)
-            
-        # Apply render state
-        state = self._create_render_state()
-        node_path.setState(state)
 
     def _create_render_state(self) -> RenderState:
+        """Get the Panda3D RenderState for this material's properties (shared between equal materials)."""
+        key = (self.cull_mode, self.blend_mode, self.depth_write)
+        state = Material._STATE_CACHE.get(key)
+        if state is None:
+            state = self._build_render_state()
+            Material._STATE_CACHE[key] = state
+        return state
+
+    def _build_render_state(self) -> RenderState:
         """Create Panda3D RenderState from material properties."""
         state = RenderState.makeEmpty()
         
@@ -1,6 +1,8 @@
 # aurora_engine/rendering/mesh.py
 
+import copy
 import numpy as np
+from functools import lru_cache
 from typing import List, Optional, Tuple
 from aurora_engine.ecs.component import Component
 from aurora_engine.rendering.material import Material
@@ -9,22 +11,276 @@ from aurora_engine.utils.profiler import profile_section
 
 logger = get_logger()
 
+# Optional JIT for the normal kernel on very large meshes
+try:
+    from numba import njit, prange, get_num_threads
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+# Triangle count above which the numba kernels are used instead of NumPy
+_NUMBA_NORMALS_MIN_TRIS = 10000
+_NUMBA_TANGENTS_MIN_TRIS = 10000
+_NUMBA_TBN_MIN_TRIS = 10000
+_NUMBA_BOUNDS_MIN_VERTS = 10000
+
+if _HAS_NUMBA:
+    @njit(parallel=True, cache=True)
+    def _normals_numba(vertices, indices, out_normals, num_chunks):
+        """Gather, cross, scatter and normalize in one pass with no Fx3 temporaries."""
+        num_faces = indices.shape[0] // 3
+        num_verts = vertices.shape[0]
+        # Each thread accumulates into its own buffer; buffers are summed afterwards
+        partial = np.zeros((num_chunks, num_verts, 3), dtype=np.float32)
+        chunk_size = (num_faces + num_chunks - 1) // num_chunks
+        for c in prange(num_chunks):
+            acc = partial[c]
+            for f in range(c * chunk_size, min((c + 1) * chunk_size, num_faces)):
+                i0 = indices[3 * f]
+                i1 = indices[3 * f + 1]
+                i2 = indices[3 * f + 2]
+                e1x = vertices[i1, 0] - vertices[i0, 0]
+                e1y = vertices[i1, 1] - vertices[i0, 1]
+                e1z = vertices[i1, 2] - vertices[i0, 2]
+                e2x = vertices[i2, 0] - vertices[i0, 0]
+                e2y = vertices[i2, 1] - vertices[i0, 1]
+                e2z = vertices[i2, 2] - vertices[i0, 2]
+                nx = e1y * e2z - e1z * e2y
+                ny = e1z * e2x - e1x * e2z
+                nz = e1x * e2y - e1y * e2x
+                for i in (i0, i1, i2):
+                    acc[i, 0] += nx
+                    acc[i, 1] += ny
+                    acc[i, 2] += nz
+
+        for v in prange(num_verts):
+            x = 0.0
+            y = 0.0
+            z = 0.0
+            for c in range(num_chunks):
+                x += partial[c, v, 0]
+                y += partial[c, v, 1]
+                z += partial[c, v, 2]
+            length = np.sqrt(x * x + y * y + z * z)
+            if length == 0.0:
+                length = 1.0
+            out_normals[v, 0] = x / length
+            out_normals[v, 1] = y / length
+            out_normals[v, 2] = z / length
+
+    @njit(cache=True)
+    def _bounds_numba(vertices):
+        """Min and max corner in a single pass over (N, 3) vertices."""
+        x0 = x1 = vertices[0, 0]
+        y0 = y1 = vertices[0, 1]
+        z0 = z1 = vertices[0, 2]
+        for i in range(1, vertices.shape[0]):
+            x = vertices[i, 0]
+            y = vertices[i, 1]
+            z = vertices[i, 2]
+            x0 = min(x0, x)
+            x1 = max(x1, x)
+            y0 = min(y0, y)
+            y1 = max(y1, y)
+            z0 = min(z0, z)
+            z1 = max(z1, z)
+        return np.array([x0, y0, z0], dtype=vertices.dtype), np.array([x1, y1, z1], dtype=vertices.dtype)
+
+    @njit(cache=True)
+    def _normalize_rows(acc, out):
+        """Normalize each row of acc into out (zero rows stay zero)."""
+        for v in range(acc.shape[0]):
+            x = acc[v, 0]
+            y = acc[v, 1]
+            z = acc[v, 2]
+            length = np.sqrt(x * x + y * y + z * z)
+            if length == 0.0:
+                length = 1.0
+            out[v, 0] = x / length
+            out[v, 1] = y / length
+            out[v, 2] = z / length
+
+    @njit(parallel=True, cache=True)
+    def _tangents_numba(vertices, uvs, indices, out_tangents, out_binormals, num_chunks):
+        """Tangent/binormal counterpart of _normals_numba (per-thread buffers, then normalize)."""
+        num_faces = indices.shape[0] // 3
+        num_verts = vertices.shape[0]
+        partial_t = np.zeros((num_chunks, num_verts, 3), dtype=np.float32)
+        partial_b = np.zeros((num_chunks, num_verts, 3), dtype=np.float32)
+        chunk_size = (num_faces + num_chunks - 1) // num_chunks
+        for c in prange(num_chunks):
+            acc_t = partial_t[c]
+            acc_b = partial_b[c]
+            for f in range(c * chunk_size, min((c + 1) * chunk_size, num_faces)):
+                i0 = indices[3 * f]
+                i1 = indices[3 * f + 1]
+                i2 = indices[3 * f + 2]
+                du1 = uvs[i1, 0] - uvs[i0, 0]
+                dv1 = uvs[i1, 1] - uvs[i0, 1]
+                du2 = uvs[i2, 0] - uvs[i0, 0]
+                dv2 = uvs[i2, 1] - uvs[i0, 1]
+                r = np.float32(1.0) / (du1 * dv2 - dv1 * du2 + np.float32(1e-6))
+                for k in range(3):
+                    dp1 = vertices[i1, k] - vertices[i0, k]
+                    dp2 = vertices[i2, k] - vertices[i0, k]
+                    t = (dp1 * dv2 - dp2 * dv1) * r
+                    b = (dp2 * du1 - dp1 * du2) * r
+                    for i in (i0, i1, i2):
+                        acc_t[i, k] += t
+                        acc_b[i, k] += b
+
+        for c in range(1, num_chunks):
+            partial_t[0] += partial_t[c]
+            partial_b[0] += partial_b[c]
+        _normalize_rows(partial_t[0], out_tangents)
+        _normalize_rows(partial_b[0], out_binormals)
+
+    @njit(parallel=True, cache=True)
+    def _tbn_numba(vertices, uvs, indices, out_normals, out_tangents, out_binormals, num_chunks):
+        """_normals_numba and _tangents_numba fused: each triangle is gathered once for all three."""
+        num_faces = indices.shape[0] // 3
+        num_verts = vertices.shape[0]
+        # Per-thread accumulators, columns: normal xyz, tangent xyz, binormal xyz
+        partial = np.zeros((num_chunks, num_verts, 9), dtype=np.float32)
+        chunk_size = (num_faces + num_chunks - 1) // num_chunks
+        for c in prange(num_chunks):
+            acc = partial[c]
+            for f in range(c * chunk_size, min((c + 1) * chunk_size, num_faces)):
+                i0 = indices[3 * f]
+                i1 = indices[3 * f + 1]
+                i2 = indices[3 * f + 2]
+                e1x = vertices[i1, 0] - vertices[i0, 0]
+                e1y = vertices[i1, 1] - vertices[i0, 1]
+                e1z = vertices[i1, 2] - vertices[i0, 2]
+                e2x = vertices[i2, 0] - vertices[i0, 0]
+                e2y = vertices[i2, 1] - vertices[i0, 1]
+                e2z = vertices[i2, 2] - vertices[i0, 2]
+                du1 = uvs[i1, 0] - uvs[i0, 0]
+                dv1 = uvs[i1, 1] - uvs[i0, 1]
+                du2 = uvs[i2, 0] - uvs[i0, 0]
+                dv2 = uvs[i2, 1] - uvs[i0, 1]
+                r = np.float32(1.0) / (du1 * dv2 - dv1 * du2 + np.float32(1e-6))
+                nx = e1y * e2z - e1z * e2y
+                ny = e1z * e2x - e1x * e2z
+                nz = e1x * e2y - e1y * e2x
+                tx = (e1x * dv2 - e2x * dv1) * r
+                ty = (e1y * dv2 - e2y * dv1) * r
+                tz = (e1z * dv2 - e2z * dv1) * r
+                bx = (e2x * du1 - e1x * du2) * r
+                by = (e2y * du1 - e1y * du2) * r
+                bz = (e2z * du1 - e1z * du2) * r
+                for i in (i0, i1, i2):
+                    acc[i, 0] += nx
+                    acc[i, 1] += ny
+                    acc[i, 2] += nz
+                    acc[i, 3] += tx
+                    acc[i, 4] += ty
+                    acc[i, 5] += tz
+                    acc[i, 6] += bx
+                    acc[i, 7] += by
+                    acc[i, 8] += bz
+
+        for c in range(1, num_chunks):
+            partial[0] += partial[c]
+        _normalize_rows(partial[0, :, 0:3], out_normals)
+        _normalize_rows(partial[0, :, 3:6], out_tangents)
+        _normalize_rows(partial[0, :, 6:9], out_binormals)
+
+# Hot vertex arrays start on a cache line (numpy only guarantees 16 bytes), so SIMD kernels can
+# use aligned loads and no row straddles two lines more than it has to
+_ALIGNMENT = 64
+
+def _aligned_empty(shape, dtype, align: int = _ALIGNMENT) -> np.ndarray:
+    """np.empty whose data starts on an `align`-byte boundary (slices an over-allocated buffer)."""
+    dtype = np.dtype(dtype)
+    nbytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(nbytes + align, dtype=np.uint8)
+    offset = -raw.ctypes.data % align
+    return raw[offset:offset + nbytes].view(dtype).reshape(shape)
+
+def _aligned_zeros(shape, dtype, align: int = _ALIGNMENT) -> np.ndarray:
+    out = _aligned_empty(shape, dtype, align)
+    out.fill(0)
+    return out
+
+def _aligned_array(data, dtype) -> np.ndarray:
+    """Contiguous, aligned copy of `data` converted to `dtype`."""
+    data = np.asarray(data)
+    out = _aligned_empty(data.shape, dtype)
+    out[...] = data
+    return out
+
+def _normalize_in_place(vectors: np.ndarray) -> np.ndarray:
+    """Scale each row of an (N, 3) float32 array to unit length; zero rows stay zero."""
+    # einsum squares and sums in one pass; multiplying by the reciprocal avoids a divide per element
+    sq = np.einsum('ij,ij->i', vectors, vectors)
+    inv = np.ones_like(sq)
+    np.sqrt(sq, out=sq)
+    np.divide(inv, sq, out=inv, where=sq > 0)
+    vectors *= inv[:, None]
+    return vectors
+
+# Interleaved per-vertex layout handed to the backend: (attribute, width, default value, storage type)
+# Integer storage means a normalized quantized column (uint8 = UNORM). Normals stay float32:
+# Panda's CPU-side readers (flattenStrong, collision from visible geometry) don't normalize int columns
+INTERLEAVED_LAYOUT = (
+    ("vertices", 3, (0.0, 0.0, 0.0), np.float32),
+    ("normals", 3, (0.0, 0.0, 0.0), np.float32),
+    ("colors", 4, (1.0, 1.0, 1.0, 1.0), np.uint8), # RGBA8, white so node color works
+    ("uvs", 2, (0.0, 0.0), np.float32),
+    ("tangents", 3, (1.0, 0.0, 0.0), np.float32),
+    ("binormals", 3, (0.0, 1.0, 0.0), np.float32),
+)
+# Packed record for one interleaved vertex; backends may pass their own aligned variant
+INTERLEAVED_DTYPE = np.dtype([(attr, storage, (width,)) for attr, width, _, storage in INTERLEAVED_LAYOUT])
+
+def quantize_unorm8(values: np.ndarray) -> np.ndarray:
+    """Quantize values in [0, 1] to uint8 UNORM (8-bit color channels)."""
+    values = np.asarray(values, dtype=np.float32)
+    return np.round(np.clip(values, 0.0, 1.0) * 255.0).astype(np.uint8)
+
+_QUANTIZERS = {np.dtype(np.uint8): quantize_unorm8}
+
+# Layout defaults converted to their storage type once (e.g. white as RGBA8 255s), so packing
+# a mesh without colors/normals/... is a plain broadcast fill
+_LAYOUT_DEFAULTS = {
+    attr: _QUANTIZERS[np.dtype(storage)](default) if np.dtype(storage) in _QUANTIZERS
+    else np.asarray(default, dtype=storage)
+    for attr, _, default, storage in INTERLEAVED_LAYOUT
+}
+
+# Computed-on-demand attributes -> backing field, read when computing them must be avoided
+_LAZY_ATTRIBUTES = {"tangents": "_tangents", "binormals": "_binormals"}
+
+def index_dtype(num_verts: int) -> type:
+    """Smallest index type for a mesh of `num_verts` vertices (uint16 halves index bandwidth).
+
+    0xFFFF stays free since backends may reserve it as the primitive-restart index.
+    """
+    return np.uint16 if num_verts < 0xFFFF else np.uint32
+
 class Mesh:
     """
     Mesh data container.
     Stores vertices, normals, UVs, indices.
     """
 
+    # Store computed normals/UVs/tangents/binormals as float16 (see compact()). Off by default:
+    # tiled UVs (terrain) and large atlases need float32 precision
+    compact_attributes = False
+
     def __init__(self, name: str = "Mesh"):
         self.name = name
 
         # Vertex data
         self.vertices: np.ndarray = np.array([], dtype=np.float32)  # Nx3
-        self.normals: np.ndarray = np.array([], dtype=np.float32)  # Nx3
+        # Nx3, None until set or first needed (then computed from the geometry, see `normals`)
+        self._normals: Optional[np.ndarray] = None
         self.uvs: np.ndarray = np.array([], dtype=np.float32)  # Nx2
         self.colors: Optional[np.ndarray] = None  # Nx4
-        self.tangents: np.ndarray = np.array([], dtype=np.float32) # Nx3
-        self.binormals: np.ndarray = np.array([], dtype=np.float32) # Nx3
+        # Nx3 each, None until set or first read (then computed, see `tangents`)
+        self._tangents: Optional[np.ndarray] = None
+        self._binormals: Optional[np.ndarray] = None
 
         # Index buffer (for indexed rendering)
         self.indices: Optional[np.ndarray] = None
@@ -35,14 +291,99 @@ class Mesh:
 
         # Backend handle (Panda3D geometry)
         self._backend_handle = None
+
+        # Interleaved buffers already built: dtype -> (source arrays, buffer). Shallow copies
+        # (e.g. cached primitives) share this dict, so one build serves every copy
+        self._interleaved = {}
         
         # logger.debug(f"Mesh '{name}' created")
 
+    @property
+    def normals(self) -> np.ndarray:
+        """Vertex normals (Nx3). Smooth normals are computed on first access if none were set."""
+        if self._normals is None:
+            if self.indices is None or len(self.indices) == 0:
+                return np.array([], dtype=np.float32)
+            self.calculate_normals()
+        return self._normals
+
+    @normals.setter
+    def normals(self, normals: np.ndarray):
+        self._normals = normals
+
+    def invalidate_normals(self):
+        """Drop normals after editing geometry; they are recomputed when next needed."""
+        self._normals = None
+
+    @property
+    def tangents(self) -> np.ndarray:
+        """Vertex tangents (Nx3), computed with the binormals on first access if none were set.
+
+        Only normal mapping samples these, so meshes that never need them skip the work.
+        """
+        if self._tangents is None:
+            if self._normals is None:
+                # Normals are missing too: one fused sweep for both
+                self.calculate_tbn()
+            else:
+                self.calculate_tangents()
+            if self._tangents is None:
+                return np.array([], dtype=np.float32)
+        return self._tangents
+
+    @tangents.setter
+    def tangents(self, tangents: np.ndarray):
+        self._tangents = tangents
+
+    @property
+    def binormals(self) -> np.ndarray:
+        """Vertex binormals (Nx3), see `tangents`."""
+        if self._binormals is None:
+            self.calculate_tangents()
+            if self._binormals is None:
+                return np.array([], dtype=np.float32)
+        return self._binormals
+
+    @binormals.setter
+    def binormals(self, binormals: np.ndarray):
+        self._binormals = binormals
+
+    def invalidate_tangents(self):
+        """Drop tangents/binormals after editing geometry or UVs; recomputed when next needed."""
+        self._tangents = None
+        self._binormals = None
+
+    def compact(self):
+        """Store normals, UVs, tangents and binormals as float16, halving their memory.
+
+        These are bounded to [-1, 1] or [0, 1] and tolerate ~10-bit precision; positions
+        stay float32. Math on them promotes back to float32 where needed.
+        """
+        # Backing fields, so compacting never triggers a lazy computation
+        for attr in ("_normals", "uvs", "_tangents", "_binormals"):
+            data = getattr(self, attr)
+            if data is not None and len(data) and data.dtype != np.float16:
+                setattr(self, attr, data.astype(np.float16))
+
+    def positions_soa(self) -> np.ndarray:
+        """Positions as a planar (3, N) array: contiguous x, y and z rows.
+
+        Position-only passes (bounds, culling) stream one axis at a time instead of
+        striding through (N, 3) rows; vertices stays the authoring/upload format.
+        """
+        return np.ascontiguousarray(np.asarray(self.vertices).T)
+
     def calculate_bounds(self):
         """Calculate bounding box from vertices."""
         if len(self.vertices) > 0:
-            self.bounds_min = np.min(self.vertices, axis=0)
-            self.bounds_max = np.max(self.vertices, axis=0)
+            if _HAS_NUMBA and len(self.vertices) > _NUMBA_BOUNDS_MIN_VERTS:
+                # Min and max fused into one pass over memory
+                self.bounds_min, self.bounds_max = _bounds_numba(np.ascontiguousarray(self.vertices))
+                return
+            # Reducing contiguous per-axis rows is far faster than an axis=0 reduction over (N, 3)
+            planar = self.positions_soa()
+            self.bounds_min = planar.min(axis=1)
+            self.bounds_max = planar.max(axis=1)
 
     def calculate_normals(self):
         """Calculate smooth normals from geometry."""
@@ -51,32 +392,69 @@ class Mesh:
                 return
 
             num_verts = len(self.vertices)
-            normals = np.zeros((num_verts, 3), dtype=np.float32)
+            normals = _aligned_zeros((num_verts, 3), np.float32)
 
-            # Accumulate face normals
-            for i in range(0, len(self.indices), 3):
-                i0, i1, i2 = self.indices[i], self.indices[i + 1], self.indices[i + 2]
-
-                v0 = self.vertices[i0]
-                v1 = self.vertices[i1]
-                v2 = self.vertices[i2]
+            if _HAS_NUMBA and len(self.indices) // 3 > _NUMBA_NORMALS_MIN_TRIS:
+                _normals_numba(self.vertices, np.ascontiguousarray(self.indices).ravel(), normals, get_num_threads())
+                self.normals = normals
+                if self.compact_attributes:
+                    self.compact()
+                return
 
-                # Calculate face normal
-                edge1 = v1 - v0
-                edge2 = v2 - v0
-                face_normal = np.cross(edge1, edge2)
+            # Gather all triangles at once and compute every face normal in one cross product
+            # (indices converted to intp once, rather than by each gather and bincount below)
+            tri = np.asarray(self.indices, dtype=np.intp).reshape(-1, 3)
+            v0 = self.vertices[tri[:, 0]]
+            face_normals = np.cross(self.vertices[tri[:, 1]] - v0, self.vertices[tri[:, 2]] - v0)
 
-                # Accumulate to vertices
-                normals[i0] += face_normal
-                normals[i1] += face_normal
-                normals[i2] += face_normal
+            # Accumulate to vertices: one bincount per axis sums the contributions of
+            # every face sharing a vertex in a single C loop (much faster than np.add.at)
+            flat = tri.ravel()
+            for axis in range(3):
+                normals[:, axis] = np.bincount(flat, weights=np.repeat(face_normals[:, axis], 3), minlength=num_verts)
 
             # Normalize
-            # Vectorized normalization for speed
-            norms = np.linalg.norm(normals, axis=1, keepdims=True)
-            # Avoid division by zero
-            norms[norms == 0] = 1.0
-            self.normals = normals / norms
+            self.normals = _normalize_in_place(normals)
+            if self.compact_attributes:
+                self.compact()
+
+    def build_interleaved(self, dtype: np.dtype = INTERLEAVED_DTYPE) -> np.ndarray:
+        """Pack all vertex attributes into one contiguous record array (one record per vertex).
+
+        `dtype` has a field per INTERLEAVED_LAYOUT attribute; integer fields are quantized.
+        Missing attributes (or rows past the end of a short array) get the layout default.
+        The buffer is 64-byte aligned. Tangents/binormals not computed yet are left at the
+        default (read `tangents` first when the material needs them).
+        The result is cached (read-only) until an attribute is reassigned; call
+        invalidate_interleaved() after editing attribute arrays in place.
+        """
+        sources = tuple(getattr(self, _LAZY_ATTRIBUTES.get(attr, attr)) for attr, *_ in INTERLEAVED_LAYOUT)
+        cached = self._interleaved.get(dtype)
+        if cached is not None and all(a is b for a, b in zip(cached[0], sources)):
+            return cached[1]
+
+        num_verts = len(self.vertices)
+        buf = _aligned_zeros(num_verts, dtype)
+        for (attr, width, default, _), data in zip(INTERLEAVED_LAYOUT, sources):
+            columns = buf[attr]
+            quantize = _QUANTIZERS.get(columns.dtype)
+            count = min(len(data), num_verts) if data is not None else 0
+            if count:
+                columns[:count] = quantize(data[:count]) if quantize else data[:count]
+            if count < num_verts:
+                fill = _LAYOUT_DEFAULTS[attr]
+                if fill.dtype != columns.dtype:
+                    # Caller's dtype stores this attribute differently from the layout
+                    fill = quantize(default) if quantize else default
+                columns[count:] = fill
+        buf.flags.writeable = False
+        # Keeping the source arrays (not their ids) means a reassigned attribute can never match
+        self._interleaved[dtype] = (sources, buf)
+        return buf
+
+    def invalidate_interleaved(self):
+        """Forget built interleaved buffers after in-place edits to attribute arrays."""
+        self._interleaved = {}
 
     def calculate_tangents(self):
         """Calculate tangents and binormals."""
@@ -85,47 +463,96 @@ class Mesh:
                 return
 
             num_verts = len(self.vertices)
-            tangents = np.zeros((num_verts, 3), dtype=np.float32)
-            binormals = np.zeros((num_verts, 3), dtype=np.float32)
-
-            for i in range(0, len(self.indices), 3):
-                i0, i1, i2 = self.indices[i], self.indices[i + 1], self.indices[i + 2]
-
-                v0 = self.vertices[i0]
-                v1 = self.vertices[i1]
-                v2 = self.vertices[i2]
-
-                uv0 = self.uvs[i0]
-                uv1 = self.uvs[i1]
-                uv2 = self.uvs[i2]
-
-                delta_pos1 = v1 - v0
-                delta_pos2 = v2 - v0
-
-                delta_uv1 = uv1 - uv0
-                delta_uv2 = uv2 - uv0
-
-                r = 1.0 / (delta_uv1[0] * delta_uv2[1] - delta_uv1[1] * delta_uv2[0] + 1e-6)
-                
-                tangent = (delta_pos1 * delta_uv2[1] - delta_pos2 * delta_uv1[1]) * r
-                binormal = (delta_pos2 * delta_uv1[0] - delta_pos1 * delta_uv2[0]) * r
-
-                tangents[i0] += tangent
-                tangents[i1] += tangent
-                tangents[i2] += tangent
+            tangents = _aligned_zeros((num_verts, 3), np.float32)
+            binormals = _aligned_zeros((num_verts, 3), np.float32)
+
+            # UV deltas of small triangles underflow in float16 (compact meshes)
+            uvs = np.asarray(self.uvs, dtype=np.float32)
+
+            if _HAS_NUMBA and len(self.indices) // 3 > _NUMBA_TANGENTS_MIN_TRIS:
+                _tangents_numba(self.vertices, np.ascontiguousarray(uvs),
+                                np.ascontiguousarray(self.indices).ravel(), tangents, binormals, get_num_threads())
+                self.tangents = tangents
+                self.binormals = binormals
+                if self.compact_attributes:
+                    self.compact()
+                return
 
-                binormals[i0] += binormal
-                binormals[i1] += binormal
-                binormals[i2] += binormal
+            # Per-face tangent frames for all triangles at once, as in calculate_normals
+            tri = np.asarray(self.indices, dtype=np.intp).reshape(-1, 3)
+            v0 = self.vertices[tri[:, 0]]
+            uv0 = uvs[tri[:, 0]]
+            delta_pos1 = self.vertices[tri[:, 1]] - v0
+            delta_pos2 = self.vertices[tri[:, 2]] - v0
+            delta_uv1 = uvs[tri[:, 1]] - uv0
+            delta_uv2 = uvs[tri[:, 2]] - uv0
+
+            r = 1.0 / (delta_uv1[:, 0] * delta_uv2[:, 1] - delta_uv1[:, 1] * delta_uv2[:, 0] + 1e-6)
+            face_tangents = (delta_pos1 * delta_uv2[:, 1:2] - delta_pos2 * delta_uv1[:, 1:2]) * r[:, None]
+            face_binormals = (delta_pos2 * delta_uv1[:, 0:1] - delta_pos1 * delta_uv2[:, 0:1]) * r[:, None]
+
+            # Accumulate to the three corners of each face
+            flat = tri.ravel()
+            for axis in range(3):
+                tangents[:, axis] = np.bincount(flat, weights=np.repeat(face_tangents[:, axis], 3), minlength=num_verts)
+                binormals[:, axis] = np.bincount(flat, weights=np.repeat(face_binormals[:, axis], 3), minlength=num_verts)
 
             # Normalize
-            t_norms = np.linalg.norm(tangents, axis=1, keepdims=True)
-            t_norms[t_norms == 0] = 1.0
-            self.tangents = tangents / t_norms
-            
-            b_norms = np.linalg.norm(binormals, axis=1, keepdims=True)
-            b_norms[b_norms == 0] = 1.0
-            self.binormals = binormals / b_norms
+            self.tangents = _normalize_in_place(tangents)
+            self.binormals = _normalize_in_place(binormals)
+            if self.compact_attributes:
+                self.compact()
+
+    def calculate_tbn(self):
+        """Calculate normals, tangents and binormals in one pass over the triangles.
+
+        Same results as calculate_normals() followed by calculate_tangents(), but every
+        triangle's vertices and UVs are gathered once instead of twice.
+        """
+        if self.indices is None or len(self.indices) == 0:
+            return
+        if len(self.uvs) == 0:
+            self.calculate_normals()
+            return
+
+        with profile_section("CalcTBN"):
+            num_verts = len(self.vertices)
+            normals = _aligned_zeros((num_verts, 3), np.float32)
+            tangents = _aligned_zeros((num_verts, 3), np.float32)
+            binormals = _aligned_zeros((num_verts, 3), np.float32)
+            uvs = np.asarray(self.uvs, dtype=np.float32)
+
+            if _HAS_NUMBA and len(self.indices) // 3 > _NUMBA_TBN_MIN_TRIS:
+                _tbn_numba(self.vertices, np.ascontiguousarray(uvs), np.ascontiguousarray(self.indices).ravel(),
+                           normals, tangents, binormals, get_num_threads())
+            else:
+                tri = np.asarray(self.indices, dtype=np.intp).reshape(-1, 3)
+                v0 = self.vertices[tri[:, 0]]
+                uv0 = uvs[tri[:, 0]]
+                edge1 = self.vertices[tri[:, 1]] - v0
+                edge2 = self.vertices[tri[:, 2]] - v0
+                delta_uv1 = uvs[tri[:, 1]] - uv0
+                delta_uv2 = uvs[tri[:, 2]] - uv0
+
+                r = 1.0 / (delta_uv1[:, 0] * delta_uv2[:, 1] - delta_uv1[:, 1] * delta_uv2[:, 0] + 1e-6)
+                # Per-face normal | tangent | binormal, repeated once for the three corners
+                face = np.empty((len(tri), 9), dtype=np.float32)
+                face[:, 0:3] = np.cross(edge1, edge2)
+                face[:, 3:6] = (edge1 * delta_uv2[:, 1:2] - edge2 * delta_uv1[:, 1:2]) * r[:, None]
+                face[:, 6:9] = (edge2 * delta_uv1[:, 0:1] - edge1 * delta_uv2[:, 0:1]) * r[:, None]
+                corners = np.repeat(face, 3, axis=0)
+
+                flat = tri.ravel()
+                for out, first in ((normals, 0), (tangents, 3), (binormals, 6)):
+                    for axis in range(3):
+                        out[:, axis] = np.bincount(flat, weights=corners[:, first + axis], minlength=num_verts)
+                    _normalize_in_place(out)
+
+            self.normals = normals
+            self.tangents = tangents
+            self.binormals = binormals
+            if self.compact_attributes:
+                self.compact()
 
 
 class MeshRenderer(Component):
@@ -134,10 +561,15 @@ class MeshRenderer(Component):
     Renders a mesh with a material.
     """
 
-    def __init__(self, mesh: Optional[Mesh] = None, material: Optional[Material] = None, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0), model_path: Optional[str] = None, texture_path: Optional[str] = None):
+    def __init__(self, mesh: Optional[Mesh] = None, material: Optional[Material] = None, color: Tuple[float, float, float, float] = (1.0, 1.0, 1.0, 1.0), model_path: Optional[str] = None, texture_path: Optional[str] = None,
+                 batch: Optional[List[Mesh]] = None, batch_offsets: Optional[np.ndarray] = None):
         super().__init__()
 
         self.mesh = mesh
+        # Vertex-colored static meshes drawn as one merged node instead of `mesh`,
+        # each translated by its row of batch_offsets (Nx3) into this entity's space
+        self.batch = batch
+        self.batch_offsets = batch_offsets
         self.material = material
         self.color = color # Simple color override if no material
         self.model_path = model_path
@@ -170,266 +602,309 @@ class MeshRenderer(Component):
 
 
 # Primitive mesh generators
+# Generated meshes are cached per parameter set and handed out as shallow copies:
+# each caller gets its own Mesh object (and backend handle) sharing read-only arrays.
+# Size-independent arrays (normals, UVs, tangents, indices) are further shared by every
+# size of a primitive. Callers that want to edit a primitive's arrays must .copy() them first.
+_MESH_ARRAYS = ("vertices", "_normals", "uvs", "colors", "_tangents", "_binormals", "indices")
+
+def _freeze_arrays(*arrays: np.ndarray) -> Tuple[np.ndarray, ...]:
+    """Mark arrays shared between primitives read-only; callers must copy before mutating."""
+    for array in arrays:
+        array.flags.writeable = False
+    return arrays
+
+def _freeze_mesh(mesh: Mesh) -> Mesh:
+    """Mark a cached mesh's arrays read-only so shared buffers can't be mutated by accident."""
+    for attr in _MESH_ARRAYS:
+        array = getattr(mesh, attr)
+        if array is not None:
+            array.flags.writeable = False
+    return mesh
+
+# Cube topology: 24 vertices (4 per face) so every face gets sharp edges (normals)
+# Winding order: Counter-Clockwise (CCW) for Front Facing
+# Corners of a cube with half-extent 1; scaled by size/2 per cube
+_CUBE_VERTS_UNIT = np.array([
+    # Front Face (Y+)
+    [-1, 1, -1], [ 1, 1, -1], [ 1, 1,  1], [-1, 1,  1], # 0, 1, 2, 3
+    # Back Face (Y-)
+    [ 1, -1, -1], [-1, -1, -1], [-1, -1,  1], [ 1, -1,  1], # 4, 5, 6, 7
+    # Left Face (X-)
+    [-1, -1, -1], [-1,  1, -1], [-1,  1,  1], [-1, -1,  1], # 8, 9, 10, 11
+    # Right Face (X+)
+    [ 1,  1, -1], [ 1, -1, -1], [ 1, -1,  1], [ 1,  1,  1], # 12, 13, 14, 15
+    # Top Face (Z+)
+    [-1,  1,  1], [ 1,  1,  1], [ 1, -1,  1], [-1, -1,  1], # 16, 17, 18, 19
+    # Bottom Face (Z-)
+    [-1, -1, -1], [ 1, -1, -1], [ 1,  1, -1], [-1,  1, -1], # 20, 21, 22, 23
+], dtype=np.float32)
+
+_CUBE_NORMALS = np.repeat(np.array([
+    [ 0,  1,  0], # Front
+    [ 0, -1,  0], # Back
+    [-1,  0,  0], # Left
+    [ 1,  0,  0], # Right
+    [ 0,  0,  1], # Top
+    [ 0,  0, -1], # Bottom
+], dtype=np.float32), 4, axis=0)
+
+# Per-face +U (tangent) and +V (binormal) directions of the UV layout below
+_CUBE_TANGENTS = np.repeat(np.array([
+    [ 1,  0,  0], # Front
+    [-1,  0,  0], # Back
+    [ 0,  1,  0], # Left
+    [ 0, -1,  0], # Right
+    [ 1,  0,  0], # Top
+    [ 1,  0,  0], # Bottom
+], dtype=np.float32), 4, axis=0)
+
+_CUBE_BINORMALS = np.repeat(np.array([
+    [ 0,  0,  1], # Front
+    [ 0,  0,  1], # Back
+    [ 0,  0,  1], # Left
+    [ 0,  0,  1], # Right
+    [ 0, -1,  0], # Top
+    [ 0,  1,  0], # Bottom
+], dtype=np.float32), 4, axis=0)
+
+_CUBE_UVS = np.tile(np.array([[0, 0], [1, 0], [1, 1], [0, 1]], dtype=np.float32), (6, 1))
+
+# Indices (CCW), two triangles per face
+_CUBE_INDICES = np.array([
+    # Front
+    0, 1, 2, 0, 2, 3,
+    # Back
+    4, 7, 6, 4, 6, 5,
+    # Left
+    8, 11, 10, 8, 10, 9,
+    # Right
+    12, 15, 14, 12, 14, 13,
+    # Top
+    16, 19, 18, 16, 18, 17,
+    # Bottom
+    20, 23, 22, 20, 22, 21
+], dtype=np.uint16)
+
+# Shared by every cube mesh, so never writable
+for _array in (_CUBE_VERTS_UNIT, _CUBE_NORMALS, _CUBE_TANGENTS, _CUBE_BINORMALS, _CUBE_UVS, _CUBE_INDICES):
+    _array.flags.writeable = False
+del _array
+
 def create_cube_mesh(size: float = 1.0) -> Mesh:
     """Create a cube mesh."""
-    mesh = Mesh("Cube")
+    return copy.copy(_create_cube_mesh_cached(size))
 
-    s = size / 2.0
-    
-    # Explicitly define 24 vertices (4 per face) to ensure sharp edges (normals)
-    # Winding order: Counter-Clockwise (CCW) for Front Facing
-    
-    vertices = [
-        # Front Face (Y+)
-        [-s, s, -s], [ s, s, -s], [ s, s,  s], [-s, s,  s], # 0, 1, 2, 3
-        # Back Face (Y-)
-        [ s, -s, -s], [-s, -s, -s], [-s, -s,  s], [ s, -s,  s], # 4, 5, 6, 7
-        # Left Face (X-)
-        [-s, -s, -s], [-s,  s, -s], [-s,  s,  s], [-s, -s,  s], # 8, 9, 10, 11
-        # Right Face (X+)
-        [ s,  s, -s], [ s, -s, -s], [ s, -s,  s], [ s,  s,  s], # 12, 13, 14, 15
-        # Top Face (Z+)
-        [-s,  s,  s], [ s,  s,  s], [ s, -s,  s], [-s, -s,  s], # 16, 17, 18, 19
-        # Bottom Face (Z-)
-        [-s, -s, -s], [ s, -s, -s], [ s,  s, -s], [-s,  s, -s], # 20, 21, 22, 23
-    ]
-
-    # Normals
-    normals = [
-        [ 0,  1,  0], [ 0,  1,  0], [ 0,  1,  0], [ 0,  1,  0], # Front
-        [ 0, -1,  0], [ 0, -1,  0], [ 0, -1,  0], [ 0, -1,  0], # Back
-        [-1,  0,  0], [-1,  0,  0], [-1,  0,  0], [-1,  0,  0], # Left
-        [ 1,  0,  0], [ 1,  0,  0], [ 1,  0,  0], [ 1,  0,  0], # Right
-        [ 0,  0,  1], [ 0,  0,  1], [ 0,  0,  1], [ 0,  0,  1], # Top
-        [ 0,  0, -1], [ 0,  0, -1], [ 0,  0, -1], [ 0,  0, -1], # Bottom
-    ]
-
-    # UVs
-    uvs = [[0, 0], [1, 0], [1, 1], [0, 1]] * 6
-
-    # Indices (CCW)
-    # 0, 1, 2, 0, 2, 3 pattern for each face
-    indices = [
-        # Front
-        0, 1, 2, 0, 2, 3,
-        # Back
-        4, 7, 6, 4, 6, 5,
-        # Left
-        8, 11, 10, 8, 10, 9,
-        # Right
-        12, 15, 14, 12, 14, 13,
-        # Top
-        16, 19, 18, 16, 18, 17,
-        # Bottom
-        20, 23, 22, 20, 22, 21
-    ]
-
-    mesh.vertices = np.array(vertices, dtype=np.float32)
-    mesh.normals = np.array(normals, dtype=np.float32)
-    mesh.uvs = np.array(uvs, dtype=np.float32)
-    mesh.indices = np.array(indices, dtype=np.uint32)
+@lru_cache(maxsize=64)
+def _create_cube_mesh_cached(size: float) -> Mesh:
+    mesh = Mesh("Cube")
 
-    mesh.calculate_bounds()
-    mesh.calculate_tangents() # Calculate tangents for primitives
+    half = np.float32(size / 2.0)
+    mesh.vertices = _CUBE_VERTS_UNIT * half
+    mesh.normals = _CUBE_NORMALS
+    mesh.tangents = _CUBE_TANGENTS
+    mesh.binormals = _CUBE_BINORMALS
+    mesh.uvs = _CUBE_UVS
+    mesh.indices = _CUBE_INDICES
 
-    return mesh
+    # Bounds are the corners themselves, no pass over the vertices needed
+    mesh.bounds_max = np.full(3, abs(half), dtype=np.float32)
+    mesh.bounds_min = -mesh.bounds_max
 
+    return _freeze_mesh(mesh)
 
-def create_sphere_mesh(radius: float = 1.0, segments: int = 16, rings: int = 8) -> Mesh:
-    """Create a UV sphere mesh."""
-    mesh = Mesh("Sphere")
 
-    vertices = []
-    normals = []
-    uvs = []
-    indices = []
+def _write_quad_indices(out: np.ndarray, upper_rows: np.ndarray, lower_rows: np.ndarray, segments: int):
+    """Fill `out` with two CCW triangles per quad between vertex rows of `segments + 1`.
 
-    # Generate vertices (Z-up)
-    for ring in range(rings + 1):
-        phi = ring * np.pi / rings # 0 to pi (top to bottom)
-        sin_phi = np.sin(phi)
-        cos_phi = np.cos(phi)
+    upper_rows/lower_rows hold the first vertex index of each row pair; `out` is a
+    preallocated slice of len(upper_rows) * segments * 6 indices.
+    """
+    seg = np.arange(segments)
+    current = upper_rows[:, None] + seg
+    below = lower_rows[:, None] + seg
+    quads = out.reshape(len(upper_rows), segments, 6)
+    # current (TL) -> below (BL) -> next seg (TR), next seg (TR) -> below (BL) -> below next (BR)
+    quads[..., 0] = current
+    quads[..., 1] = below
+    quads[..., 2] = current + 1
+    quads[..., 3] = current + 1
+    quads[..., 4] = below
+    quads[..., 5] = below + 1
 
-        for seg in range(segments + 1):
-            theta = seg * 2.0 * np.pi / segments # 0 to 2pi (around Z)
-            sin_theta = np.sin(theta)
-            cos_theta = np.cos(theta)
 
-            x = sin_phi * cos_theta
-            y = sin_phi * sin_theta
-            z = cos_phi
+def create_sphere_mesh(radius: float = 1.0, segments: int = 16, rings: int = 8) -> Mesh:
+    """Create a UV sphere mesh."""
+    return copy.copy(_create_sphere_mesh_cached(radius, segments, rings))
 
-            vertices.append([x * radius, y * radius, z * radius])
-            normals.append([x, y, z])
-            uvs.append([seg / segments, ring / rings])
+@lru_cache(maxsize=64)
+def _create_sphere_mesh_cached(radius: float, segments: int, rings: int) -> Mesh:
+    mesh = Mesh("Sphere")
 
-    # Generate indices
-    for ring in range(rings):
-        for seg in range(segments):
-            current = ring * (segments + 1) + seg
-            next_seg = current + 1
-            next_ring = current + segments + 1
-            next_both = next_ring + 1
-
-            # CCW Winding:
-            # current (TL) -> next_ring (BL) -> next_seg (TR)
-            # next_seg (TR) -> next_ring (BL) -> next_both (BR)
-            indices.extend([current, next_ring, next_seg])
-            indices.extend([next_seg, next_ring, next_both])
-
-    mesh.vertices = np.array(vertices, dtype=np.float32)
-    mesh.normals = np.array(normals, dtype=np.float32)
-    mesh.uvs = np.array(uvs, dtype=np.float32)
-    mesh.indices = np.array(indices, dtype=np.uint32)
+    # Only positions depend on the radius; the rest is shared by every sphere of this tessellation
+    normals, tangents, binormals, uvs, indices = _sphere_frame(segments, rings)
+    mesh.vertices = np.multiply(normals, np.float32(radius), out=_aligned_empty(normals.shape, np.float32))
+    mesh.normals = normals
+    mesh.tangents = tangents
+    mesh.binormals = binormals
+    mesh.uvs = uvs
+    mesh.indices = indices
 
     mesh.calculate_bounds()
-    mesh.calculate_tangents()
 
-    return mesh
+    return _freeze_mesh(mesh)
+
+@lru_cache(maxsize=64)
+def _sphere_frame(segments: int, rings: int) -> Tuple[np.ndarray, ...]:
+    """Unit normals, tangents, binormals, UVs and indices of a UV sphere (read-only, shared)."""
+    # Generate vertices (Z-up) on a (rings+1) x (segments+1) grid
+    ring_steps = np.arange(rings + 1)
+    seg_steps = np.arange(segments + 1)
+    phi = ring_steps * np.pi / rings # 0 to pi (top to bottom)
+    theta = seg_steps * 2.0 * np.pi / segments # 0 to 2pi (around Z)
+    sin_phi = np.sin(phi)[:, None]
+    cos_phi = np.cos(phi)[:, None]
+
+    x = sin_phi * np.cos(theta)
+    y = sin_phi * np.sin(theta)
+    z = np.broadcast_to(cos_phi, x.shape)
+    normals = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+
+    # Analytic tangent frame: U follows theta (dP/dtheta), V follows phi (dP/dphi), both unit length
+    sin_theta = np.sin(theta)
+    cos_theta = np.cos(theta)
+    tangents = np.stack(np.broadcast_arrays(-sin_theta, cos_theta, 0.0), axis=-1)
+    tangents = np.broadcast_to(tangents, (rings + 1, segments + 1, 3)).reshape(-1, 3)
+    binormals = np.stack([cos_phi * cos_theta, cos_phi * sin_theta, np.broadcast_to(-sin_phi, x.shape)], axis=-1).reshape(-1, 3)
+
+    u, v = np.meshgrid(seg_steps / segments, ring_steps / rings)
+    uvs = np.stack([u, v], axis=-1).reshape(-1, 2)
 
+    # Generate indices
+    indices = _aligned_empty(rings * segments * 6, index_dtype((rings + 1) * (segments + 1)))
+    ring_starts = np.arange(rings) * (segments + 1)
+    _write_quad_indices(indices, ring_starts, ring_starts + segments + 1, segments)
+
+    return _freeze_arrays(_aligned_array(normals, np.float32), _aligned_array(tangents, np.float32),
+                          _aligned_array(binormals, np.float32), _aligned_array(uvs, np.float32), indices)
+
+
+# XY Plane (Z=0) with half-extents 1; scaled by (width/2, height/2) per plane
+_PLANE_VERTS_UNIT = np.array([
+    [-1, 1, 0],  # 0: Top-Left
+    [1, 1, 0],   # 1: Top-Right
+    [1, -1, 0],  # 2: Bottom-Right
+    [-1, -1, 0], # 3: Bottom-Left
+], dtype=np.float32)
+
+_PLANE_NORMALS = np.array([
+    [0, 0, 1],
+    [0, 0, 1],
+    [0, 0, 1],
+    [0, 0, 1],
+], dtype=np.float32)
+
+# U runs along +X, V along +Y
+_PLANE_TANGENTS = np.array([[1, 0, 0]] * 4, dtype=np.float32)
+_PLANE_BINORMALS = np.array([[0, 1, 0]] * 4, dtype=np.float32)
+
+_PLANE_UVS = np.array([
+    [0, 1],
+    [1, 1],
+    [1, 0],
+    [0, 0],
+], dtype=np.float32)
+
+# CCW Winding for +Z normal
+# 0(TL) -> 2(BR) -> 1(TR)
+# 0(TL) -> 3(BL) -> 2(BR)
+_PLANE_INDICES = np.array([0, 2, 1, 0, 3, 2], dtype=np.uint16)
+
+for _array in (_PLANE_VERTS_UNIT, _PLANE_NORMALS, _PLANE_TANGENTS, _PLANE_BINORMALS, _PLANE_UVS, _PLANE_INDICES):
+    _array.flags.writeable = False
+del _array
 
 def create_plane_mesh(width: float = 1.0, height: float = 1.0) -> Mesh:
     """Create a plane mesh (XY plane, Z-up)."""
+    return copy.copy(_create_plane_mesh_cached(width, height))
+
+@lru_cache(maxsize=64)
+def _create_plane_mesh_cached(width: float, height: float) -> Mesh:
     mesh = Mesh("Plane")
 
-    w = width / 2.0
-    h = height / 2.0
-
-    # XY Plane (Z=0)
-    vertices = [
-        [-w, h, 0],  # 0: Top-Left
-        [w, h, 0],   # 1: Top-Right
-        [w, -h, 0],  # 2: Bottom-Right
-        [-w, -h, 0], # 3: Bottom-Left
-    ]
-
-    normals = [
-        [0, 0, 1],
-        [0, 0, 1],
-        [0, 0, 1],
-        [0, 0, 1],
-    ]
-
-    uvs = [
-        [0, 1],
-        [1, 1],
-        [1, 0],
-        [0, 0],
-    ]
-
-    # CCW Winding for +Z normal
-    # 0(TL) -> 2(BR) -> 1(TR)
-    # 0(TL) -> 3(BL) -> 2(BR)
-    indices = [0, 2, 1, 0, 3, 2]
-
-    mesh.vertices = np.array(vertices, dtype=np.float32)
-    mesh.normals = np.array(normals, dtype=np.float32)
-    mesh.uvs = np.array(uvs, dtype=np.float32)
-    mesh.indices = np.array(indices, dtype=np.uint32)
+    mesh.vertices = _PLANE_VERTS_UNIT * np.array([width / 2.0, height / 2.0, 0.0], dtype=np.float32)
+    mesh.normals = _PLANE_NORMALS
+    mesh.tangents = _PLANE_TANGENTS
+    mesh.binormals = _PLANE_BINORMALS
+    mesh.uvs = _PLANE_UVS
+    mesh.indices = _PLANE_INDICES
 
     mesh.calculate_bounds()
-    mesh.calculate_tangents()
 
-    return mesh
+    return _freeze_mesh(mesh)
 
 def create_capsule_mesh(radius: float = 0.5, height: float = 1.0, segments: int = 12, rings: int = 6) -> Mesh:
     """Create a capsule mesh (cylinder with hemispherical caps)."""
+    return copy.copy(_create_capsule_mesh_cached(radius, height, segments, rings))
+
+@lru_cache(maxsize=64)
+def _create_capsule_mesh_cached(radius: float, height: float, segments: int, rings: int) -> Mesh:
     mesh = Mesh("Capsule")
     
-    vertices = []
-    normals = []
-    uvs = []
-    indices = []
-    
     # Cylinder height is the straight part. Total height = height + 2*radius.
     # Let's assume 'height' is the total height.
     cyl_height = max(0, height - 2 * radius)
     half_cyl = cyl_height / 2.0
+
+    # Unit hemispheres scaled by the radius, then pushed apart by the straight part
+    normals, uvs, indices = _capsule_frame(segments, rings)
+    offset_idx = len(normals) // 2 # First vertex of the bottom hemisphere
+    vertices = np.multiply(normals, np.float32(radius), out=_aligned_empty(normals.shape, np.float32))
+    vertices[:offset_idx, 2] += np.float32(half_cyl)
+    vertices[offset_idx:, 2] -= np.float32(half_cyl)
+
+    mesh.vertices = vertices
+    mesh.normals = normals
+    mesh.uvs = uvs
+    mesh.indices = indices
     
-    # Top Hemisphere
-    for ring in range(rings + 1):
-        phi = ring * (np.pi / 2) / rings # 0 to pi/2
-        sin_phi = np.sin(phi)
-        cos_phi = np.cos(phi)
-        
-        for seg in range(segments + 1):
-            theta = seg * 2.0 * np.pi / segments
-            sin_theta = np.sin(theta)
-            cos_theta = np.cos(theta)
-            
-            x = sin_phi * cos_theta * radius
-            y = sin_phi * sin_theta * radius
-            z = cos_phi * radius + half_cyl
-            
-            vertices.append([x, y, z])
-            normals.append([sin_phi * cos_theta, sin_phi * sin_theta, cos_phi])
-            uvs.append([seg / segments, ring / (rings * 2 + 1)]) # Approx UV
-            
-    # Bottom Hemisphere
-    offset_idx = len(vertices)
-    for ring in range(rings + 1):
-        phi = (np.pi / 2) + ring * (np.pi / 2) / rings # pi/2 to pi
-        sin_phi = np.sin(phi)
-        cos_phi = np.cos(phi)
-        
-        for seg in range(segments + 1):
-            theta = seg * 2.0 * np.pi / segments
-            sin_theta = np.sin(theta)
-            cos_theta = np.cos(theta)
-            
-            x = sin_phi * cos_theta * radius
-            y = sin_phi * sin_theta * radius
-            z = cos_phi * radius - half_cyl
-            
-            vertices.append([x, y, z])
-            normals.append([sin_phi * cos_theta, sin_phi * sin_theta, cos_phi])
-            uvs.append([seg / segments, 0.5 + ring / (rings * 2 + 1)])
-            
-    # Indices (similar to sphere but split)
+    mesh.calculate_bounds()
+    # Tangents are computed per copy on first use (see Mesh.tangents)
+    return _freeze_mesh(mesh)
+
+@lru_cache(maxsize=64)
+def _capsule_frame(segments: int, rings: int) -> Tuple[np.ndarray, ...]:
+    """Unit hemisphere normals, UVs and indices of a capsule (read-only, shared)."""
+    # Both hemispheres as one (2, rings + 1, segments + 1) grid: cap 0 is the top
+    # (phi 0 to pi/2), cap 1 the bottom (phi pi/2 to pi)
+    ring_steps = np.arange(rings + 1)
+    phi = np.stack([ring_steps * (np.pi / 2) / rings, (np.pi / 2) + ring_steps * (np.pi / 2) / rings])
+    theta = np.arange(segments + 1) * 2.0 * np.pi / segments
+    sin_phi = np.sin(phi)[:, :, None]
+    cos_phi = np.cos(phi)[:, :, None]
+
+    normals = np.empty((2, rings + 1, segments + 1, 3))
+    normals[..., 0] = sin_phi * np.cos(theta)
+    normals[..., 1] = sin_phi * np.sin(theta)
+    normals[..., 2] = cos_phi
+
+    uvs = np.empty((2, rings + 1, segments + 1, 2))
+    uvs[..., 0] = np.arange(segments + 1) / segments # Approx UV
+    uvs[..., 1] = (ring_steps / (rings * 2 + 1))[:, None] + np.array([0.0, 0.5])[:, None, None]
+
+    offset_idx = (rings + 1) * (segments + 1) # First vertex of the bottom hemisphere
+
+    # Indices (similar to sphere but split), written straight into one index buffer
+    cap_size = rings * segments * 6
+    indices = _aligned_empty(2 * cap_size + segments * 6, index_dtype(2 * offset_idx))
+    ring_starts = np.arange(rings) * (segments + 1)
     # Top Cap
-    for ring in range(rings):
-        for seg in range(segments):
-            curr = ring * (segments + 1) + seg
-            next_seg = curr + 1
-            next_ring = curr + (segments + 1)
-            next_both = next_ring + 1
-            
-            indices.extend([curr, next_ring, next_seg])
-            indices.extend([next_seg, next_ring, next_both])
-            
+    _write_quad_indices(indices[:cap_size], ring_starts, ring_starts + segments + 1, segments)
     # Bottom Cap
-    for ring in range(rings):
-        for seg in range(segments):
-            curr = offset_idx + ring * (segments + 1) + seg
-            next_seg = curr + 1
-            next_ring = curr + (segments + 1)
-            next_both = next_ring + 1
-            
-            indices.extend([curr, next_ring, next_seg])
-            indices.extend([next_seg, next_ring, next_both])
-            
-    # Cylinder Body (Connect bottom of top cap to top of bottom cap)
-    # Top cap bottom ring is at index: rings * (segments + 1)
-    # Bottom cap top ring is at index: offset_idx
-    top_ring_start = rings * (segments + 1)
-    bottom_ring_start = offset_idx
-    
-    for seg in range(segments):
-        t1 = top_ring_start + seg
-        t2 = top_ring_start + seg + 1
-        b1 = bottom_ring_start + seg
-        b2 = bottom_ring_start + seg + 1
-        
-        # Quad: t1, b1, b2, t2
-        # CCW: t1 -> b1 -> t2, t2 -> b1 -> b2
-        indices.extend([t1, b1, t2])
-        indices.extend([t2, b1, b2])
-        
-    mesh.vertices = np.array(vertices, dtype=np.float32)
-    mesh.normals = np.array(normals, dtype=np.float32)
-    mesh.uvs = np.array(uvs, dtype=np.float32)
-    mesh.indices = np.array(indices, dtype=np.uint32)
-    
-    mesh.calculate_bounds()
-    mesh.calculate_tangents()
-    return mesh
+    ring_starts += offset_idx
+    _write_quad_indices(indices[cap_size:2 * cap_size], ring_starts, ring_starts + segments + 1, segments)
+    # Cylinder Body (Connect bottom ring of top cap to top ring of bottom cap)
+    _write_quad_indices(indices[2 * cap_size:], np.array([rings * (segments + 1)]), np.array([offset_idx]), segments)
+
+    return _freeze_arrays(_aligned_array(normals.reshape(-1, 3), np.float32),
+                          _aligned_array(uvs.reshape(-1, 2), np.float32), indices)
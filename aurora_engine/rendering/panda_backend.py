@@ -2,43 +2,24 @@
 
 import numpy as np
 from panda3d.core import *
-from aurora_engine.rendering.mesh import Mesh
+from aurora_engine.rendering.mesh import Mesh, INTERLEAVED_LAYOUT, index_dtype
 import weakref
 from aurora_engine.core.logging import get_logger
 from aurora_engine.utils.profiler import profile_section
 import os
 import sys
+import builtins
+from typing import List, Optional
+from direct.showbase.ShowBase import ShowBase
 
 logger = get_logger()
 
-class PandaBackend:
-    """
-    Panda3D rendering backend adapter.
-    Isolates Panda3D-specific code from engine.
-    """
-
-    def __init__(self, config: dict):
-        self.config = config
-        self.window = None
-        self.scene_graph = None
-        self.base = None
-        
-        # Use a standard dictionary for explicit control
-        self._mesh_cache = {}
-        # logger.debug("PandaBackend initialized")
-
-    def initialize(self):
-        """Initialize Panda3D."""
-        # Apply custom patch for bufferView KeyError EARLY
-        # This must happen before any GLTF loading or simplepbr init
-        self._patch_gltf_loader()
-
-        # Load config
-        # AGGRESSIVE MEMORY OPTIMIZATION
-        # Added gl-version 3 2 to force Core Profile on macOS for GLSL 1.50+ support
-        load_prc_file_data("", f"""
-            win-size {self.config.get('width', 1920)} {self.config.get('height', 1080)}
-            window-title {self.config.get('title', 'Aurora Engine')}
+# Panda3D config applied by initialize(); window size/title are filled in from the engine config
+# AGGRESSIVE MEMORY OPTIMIZATION
+# Added gl-version 3 2 to force Core Profile on macOS for GLSL 1.50+ support
+_PRC_TEMPLATE = """
+            win-size {width} {height}
+            window-title {title}
             framebuffer-multisample 1
             multisamples 2
             gl-coordinate-system default
@@ -46,7 +27,7 @@ class PandaBackend:
             
             # --- Memory Optimization ---
             # Cache models to disk to avoid reprocessing
-            # model-cache-dir {os.path.abspath('.panda3d_cache')}
+            # model-cache-dir {cache_dir}
             # model-cache-textures 1
             
             # Compress textures in RAM (Huge savings)
@@ -69,16 +50,81 @@ class PandaBackend:
             
             # Transform cache
             transform-cache-size 5000
-        """)
+"""
+
+# Panda3D column for each interleaved Mesh attribute, in INTERLEAVED_LAYOUT order
+_VERTEX_COLUMNS = {
+    "vertices": (InternalName.getVertex(), Geom.CPoint),
+    "normals": (InternalName.getNormal(), Geom.CVector),
+    "colors": (InternalName.getColor(), Geom.CColor),
+    "uvs": (InternalName.getTexcoord(), Geom.CTexcoord),
+    "tangents": (InternalName.getTangent(), Geom.CVector),
+    "binormals": (InternalName.getBinormal(), Geom.CVector),
+}
+_NUMERIC_TYPES = {
+    np.dtype(np.float32): Geom.NTFloat32,
+    np.dtype(np.uint16): Geom.NTUint16,
+    np.dtype(np.uint8): Geom.NTUint8,
+    np.dtype(np.uint32): Geom.NTUint32,
+}
+# Index array types GeomTriangles can take as-is
+_INDEX_DTYPES = (np.dtype(np.uint16), np.dtype(np.uint32))
+
+def _cache_sources(mesh: Mesh) -> tuple:
+    """Arrays besides vertices/tangents an uploaded GeomNode was built from (lazy ones unread)."""
+    return mesh._normals, mesh.uvs, mesh.colors, mesh.indices
+
+class PandaBackend:
+    """
+    Panda3D rendering backend adapter.
+    Isolates Panda3D-specific code from engine.
+    """
+
+    # Shared mesh vertex format, built on first upload
+    _vertex_format = None
+    _vertex_dtype = None
+    # Whether the active shaders sample normal maps (and so need mesh tangents); set in initialize
+    use_normal_maps = True
+
+    def __init__(self, config: dict):
+        self.config = config
+        self.window = None
+        self.scene_graph = None
+        self.base = None
+        
+        # id(mesh.vertices) -> (other source arrays, tangents, uploaded GeomNode). Keyed by the
+        # position array so shallow copies of a cached primitive share one GeomNode; dropped by a
+        # finalizer when that array is garbage collected, so it doesn't keep meshes alive
+        self._mesh_cache = {}
+        # Scratch matrix for update_mesh_node; setMat copies it, so one serves every node
+        self._scratch_mat = LMatrix4f()
+        # Per-frame bindings into ShowBase, set in initialize
+        self._camera = None
+        self._cam = None
+        self._task_step = None
+        # logger.debug("PandaBackend initialized")
+
+    def initialize(self):
+        """Initialize Panda3D."""
+        # Apply custom patch for bufferView KeyError EARLY
+        # This must happen before any GLTF loading or simplepbr init
+        self._patch_gltf_loader()
+
+        # Load config
+        load_prc_file_data("", _PRC_TEMPLATE.format(
+            width=self.config.get('width', 1920),
+            height=self.config.get('height', 1080),
+            title=self.config.get('title', 'Aurora Engine'),
+            cache_dir=os.path.abspath('.panda3d_cache'),
+        ))
 
         # Create window
-        from direct.showbase.ShowBase import ShowBase
         # Check if ShowBase is already initialized
-        import builtins
-        if hasattr(builtins, 'base'):
-            self.base = builtins.base
-        else:
-            self.base = ShowBase()
+        self.base = getattr(builtins, 'base', None) or ShowBase()
+        # Bound once; used every frame
+        self._camera = self.base.camera
+        self._cam = self.base.cam
+        self._task_step = self.base.taskMgr.step
             
         self.window = self.base.win
 
@@ -114,6 +160,8 @@ class PandaBackend:
         except ImportError:
             logger.warning("simplepbr not found. PBR materials might not look correct.")
             has_simplepbr = False
+        # The auto shader only normal-maps nodes with a normal texture, which engine meshes never get
+        self.use_normal_maps = has_simplepbr
 
         # Try patching loader for GLTF if simplepbr didn't do it (or just to be safe/explicit)
         # But avoid double patching if simplepbr already did it
@@ -131,8 +179,13 @@ class PandaBackend:
 
             # Only enable auto shader if simplepbr is NOT present
             if not has_simplepbr:
-                self.scene_graph.setShaderAuto()
-                logger.info("Enabled setShaderAuto() as fallback")
+                # Same as setShaderAuto(), plus hardware skinning: the generated shader blends
+                # joint matrices per vertex on the GPU, so animated Actors no longer re-skin
+                # and re-upload their vertex data on the CPU every frame
+                # (simplepbr enables this by default for its own shaders)
+                self.scene_graph.setAttrib(
+                    ShaderAttrib.make().setShaderAuto().setFlag(ShaderAttrib.F_hardware_skinning, True))
+                logger.info("Enabled setShaderAuto() as fallback (hardware skinning on)")
             else:
                 logger.info("Skipping setShaderAuto() because simplepbr is active")
 
@@ -303,16 +356,17 @@ class PandaBackend:
         """Clear color and depth buffers."""
         # Panda3D handles this automatically
         # But we need to call taskMgr.step() somewhere if we are running our own loop.
-        if self.base:
+        if self._task_step:
             with profile_section("PandaTaskStep"):
-                self.base.taskMgr.step()
+                self._task_step()
 
     def update_camera_transform(self, pos: np.ndarray, rot: np.ndarray):
         """Update Panda3D camera node transform."""
-        if self.base and self.base.camera:
-            self.base.camera.setPos(pos[0], pos[1], pos[2])
+        camera = self._camera
+        if camera:
+            camera.setPos(pos[0], pos[1], pos[2])
             # Panda Quat is (w, x, y, z)
-            self.base.camera.setQuat(Quat(rot[3], rot[0], rot[1], rot[2]))
+            camera.setQuat(Quat(rot[3], rot[0], rot[1], rot[2]))
 
     def set_view_projection(self, view: np.ndarray, projection: np.ndarray):
         """Set camera matrices."""
@@ -323,27 +377,22 @@ class PandaBackend:
         # TODO: Update Lens properties if projection changes (FOV, etc.)
         pass
 
-    def draw_mesh(self, mesh: Mesh, world_matrix: np.ndarray):
-        """Draw a mesh with given transform."""
-        if not mesh:
-            return
-
-        # Check cache
-        if mesh not in self._mesh_cache:
-            self._upload_mesh(mesh)
-            
-        # This method is for immediate mode which we are not fully using.
-        # See update_mesh_node for retained mode updates.
-        pass
+    def is_in_view(self, node_path: NodePath) -> bool:
+        """Whether any part of a node's bounds is inside the main camera's frustum."""
+        cam = self._cam
+        if cam is None:
+            return True
+        # Bounds in the camera's space against the lens frustum (also camera space)
+        bounds = node_path.getBounds().makeCopy()
+        bounds.xform(node_path.getMat(cam))
+        return cam.node().getLens().makeBounds().contains(bounds) != BoundingVolume.IF_no_intersection
 
     def update_mesh_node(self, node_path: NodePath, world_matrix: np.ndarray):
         """Update transform of a node path using matrix."""
-        # Slow path
-        mat = LMatrix4f()
-        for i in range(4):
-            for j in range(4):
-                # Transpose for Panda3D (Row-Major)
-                mat.setCell(j, i, world_matrix[i, j])
+        # Panda3D is row-major (row vectors), so its rows are our columns:
+        # column-major order of world_matrix is exactly the 16 cell values
+        mat = self._scratch_mat
+        mat.set(*world_matrix.ravel(order='F').tolist())
         node_path.setMat(mat)
 
     def update_mesh_transform(self, node_path: NodePath, pos: np.ndarray, rot: np.ndarray, scale: np.ndarray):
@@ -358,99 +407,135 @@ class PandaBackend:
         node_path.setScale(scale[0], scale[1], scale[2])
 
     def create_mesh_node(self, mesh: Mesh) -> NodePath:
-        """Create a NodePath for a mesh."""
-        if mesh not in self._mesh_cache:
-            self._upload_mesh(mesh)
-            
-        geom_node = self._mesh_cache[mesh]
-        return NodePath(geom_node)
+        """Create a NodePath for a mesh.
+
+        Every call returns a new node holding an instance of the mesh's one GeomNode, so
+        entities sharing a mesh (or copies of one cached primitive) share its vertex buffers
+        but keep their own transform/state.
+        """
+        entry = self._mesh_cache.get(id(mesh.vertices))
+        # Tangents are derived from the other arrays: a copy that hasn't computed its own can reuse them
+        if (entry is not None and all(a is b for a, b in zip(entry[0], _cache_sources(mesh)))
+                and (mesh._tangents is None or mesh._tangents is entry[1])):
+            geom_node = entry[2]
+        else:
+            geom_node = self._upload_mesh(mesh)
+        node_path = NodePath(mesh.name)
+        # Attaching the existing node adds another parent to it: an instance, not a copy
+        node_path.attachNewNode(geom_node)
+        return node_path
         
     def unload_mesh(self, mesh: Mesh):
-        """Explicitly remove a mesh from the cache."""
-        if mesh in self._mesh_cache:
-            del self._mesh_cache[mesh]
-            # logger.debug(f"Unloaded mesh '{mesh.name}' from backend")
+        """Explicitly remove a mesh (and copies sharing its vertices) from the cache."""
+        self._mesh_cache.pop(id(mesh.vertices), None)
+        # logger.debug(f"Unloaded mesh '{mesh.name}' from backend")
 
-    def _upload_mesh(self, mesh: Mesh):
-        """Convert Mesh to Panda3D GeomNode."""
-        with profile_section("UploadMesh"):
+    def _get_vertex_format(self):
+        """Registered single-array vertex format for meshes, plus the matching NumPy record dtype."""
+        if PandaBackend._vertex_format is None:
             # Use custom format with Tangent and Binormal for PBR
             array_format = GeomVertexArrayFormat()
-            array_format.addColumn(InternalName.getVertex(), 3, Geom.NTFloat32, Geom.CPoint)
-            array_format.addColumn(InternalName.getNormal(), 3, Geom.NTFloat32, Geom.CVector)
-            array_format.addColumn(InternalName.getColor(), 4, Geom.NTFloat32, Geom.CColor)
-            array_format.addColumn(InternalName.getTexcoord(), 2, Geom.NTFloat32, Geom.CTexcoord)
-            array_format.addColumn(InternalName.getTangent(), 3, Geom.NTFloat32, Geom.CVector)
-            array_format.addColumn(InternalName.getBinormal(), 3, Geom.NTFloat32, Geom.CVector)
+            for attr, width, _, storage in INTERLEAVED_LAYOUT:
+                name, contents = _VERTEX_COLUMNS[attr]
+                array_format.addColumn(name, width, _NUMERIC_TYPES[np.dtype(storage)], contents)
             
             format = GeomVertexFormat()
             format.addArray(array_format)
             format = GeomVertexFormat.registerFormat(format)
             
-            vdata = GeomVertexData(mesh.name, format, Geom.UHStatic)
-            
-            # Vertices
-            vertex = GeomVertexWriter(vdata, 'vertex')
-            normal = GeomVertexWriter(vdata, 'normal')
-            color = GeomVertexWriter(vdata, 'color')
-            texcoord = GeomVertexWriter(vdata, 'texcoord')
-            tangent = GeomVertexWriter(vdata, 'tangent')
-            binormal = GeomVertexWriter(vdata, 'binormal')
-            
-            # Ensure tangents are calculated
-            if len(mesh.tangents) == 0 and len(mesh.uvs) > 0:
-                mesh.calculate_tangents()
-            
-            for i in range(len(mesh.vertices)):
-                v = mesh.vertices[i]
-                vertex.addData3(v[0], v[1], v[2])
-                
-                if len(mesh.normals) > i:
-                    n = mesh.normals[i]
-                    normal.addData3(n[0], n[1], n[2])
-                    
-                if mesh.colors is not None and len(mesh.colors) > i:
-                    c = mesh.colors[i]
-                    color.addData4(c[0], c[1], c[2], c[3])
-                else:
-                    # Default to White so node color works
-                    color.addData4(1, 1, 1, 1)
-                    
-                if len(mesh.uvs) > i:
-                    uv = mesh.uvs[i]
-                    texcoord.addData2(uv[0], uv[1])
-                    
-                if len(mesh.tangents) > i:
-                    t = mesh.tangents[i]
-                    tangent.addData3(t[0], t[1], t[2])
-                else:
-                    tangent.addData3(1, 0, 0)
-                    
-                if len(mesh.binormals) > i:
-                    b = mesh.binormals[i]
-                    binormal.addData3(b[0], b[1], b[2])
-                else:
-                    binormal.addData3(0, 1, 0)
-                    
-            # Primitives
-            geom = Geom(vdata)
-            tris = GeomTriangles(Geom.UHStatic)
-            
-            if mesh.indices is not None:
-                for i in range(0, len(mesh.indices), 3):
-                    tris.addVertices(int(mesh.indices[i]), int(mesh.indices[i+1]), int(mesh.indices[i+2]))
-            else:
-                # Non-indexed
-                for i in range(0, len(mesh.vertices), 3):
-                    tris.addVertices(i, i+1, i+2)
-                    
-            geom.addPrimitive(tris)
-            
+            # Mirror Panda's column offsets (it may pad for alignment) and stride
+            array_format = format.getArray(0)
+            PandaBackend._vertex_dtype = np.dtype({
+                "names": [attr for attr, *_ in INTERLEAVED_LAYOUT],
+                "formats": [(storage, (width,)) for _, width, _, storage in INTERLEAVED_LAYOUT],
+                "offsets": [array_format.getColumn(_VERTEX_COLUMNS[attr][0]).getStart() for attr, *_ in INTERLEAVED_LAYOUT],
+                "itemsize": array_format.getStride(),
+            })
+            PandaBackend._vertex_format = format
+        return PandaBackend._vertex_format, PandaBackend._vertex_dtype
+
+    def _upload_mesh(self, mesh: Mesh) -> GeomNode:
+        """Convert Mesh to Panda3D GeomNode."""
+        with profile_section("UploadMesh"):
+            # Tangents are only sampled by normal mapping; otherwise the layout default is uploaded
+            if self.use_normal_maps:
+                mesh.tangents # computes them if not set
+
+            # Vertices: one record per vertex laid out exactly like the Panda3D array,
+            # so the whole vertex array is filled with a single copy
+            interleaved = mesh.build_interleaved(self._get_vertex_format()[1])
             node = GeomNode(mesh.name)
-            node.addGeom(geom)
+            node.addGeom(self._build_geom(mesh.name, interleaved, mesh.indices))
             
-            self._mesh_cache[mesh] = node
+            key = id(mesh.vertices)
+            if key not in self._mesh_cache:
+                # First upload of these vertices; forget the node once the array is gone
+                weakref.finalize(mesh.vertices, self._mesh_cache.pop, key, None)
+            self._mesh_cache[key] = (_cache_sources(mesh), mesh._tangents, node)
             # logger.debug(f"Uploaded mesh '{mesh.name}' to backend")
+            return node
+
+    def upload_meshes_batched(self, meshes: List[Mesh], offsets: Optional[np.ndarray] = None,
+                              name: str = "Batch") -> NodePath:
+        """Merge meshes into one GeomNode drawn with a single Geom (one draw call).
+
+        For many small static meshes sharing a material (e.g. chunk props): `offsets` (Nx3)
+        translates each mesh into the batch's space. The batch moves as a whole, its parts
+        can't move on their own.
+        """
+        with profile_section("UploadBatch"):
+            vertex_dtype = self._get_vertex_format()[1]
+            if self.use_normal_maps:
+                for mesh in meshes:
+                    mesh.tangents
+
+            parts = [mesh.build_interleaved(vertex_dtype) for mesh in meshes]
+            starts = np.cumsum([0] + [len(part) for part in parts])
+            # Filled slice by slice: np.concatenate would repack the padded record dtype
+            interleaved = np.empty(starts[-1], dtype=vertex_dtype)
+            for part, start in zip(parts, starts):
+                interleaved[start:start + len(part)] = part
+            if offsets is not None:
+                interleaved['vertices'] += np.repeat(np.asarray(offsets, dtype=np.float32),
+                                                     [len(part) for part in parts], axis=0)
+            # Rebase every mesh's triangles onto its first vertex in the merged array
+            indices = np.concatenate([
+                (np.asarray(mesh.indices, dtype=np.int64) if mesh.indices is not None
+                 else np.arange(len(part) - len(part) % 3)) + start
+                for mesh, part, start in zip(meshes, parts, starts)
+            ]).astype(index_dtype(len(interleaved)))
+
+            node = GeomNode(name)
+            node.addGeom(self._build_geom(name, interleaved, indices))
+            return NodePath(node)
+
+    def _build_geom(self, name: str, interleaved: np.ndarray, indices: Optional[np.ndarray]) -> Geom:
+        """Geom with one triangle list over an interleaved vertex buffer (None indices: non-indexed)."""
+        vdata = GeomVertexData(name, self._get_vertex_format()[0], Geom.UHStatic)
+        # Rows are sized without zero-filling, the copy overwrites every byte
+        vdata.uncleanSetNumRows(len(interleaved))
+        vdata.modifyArrayHandle(0).copyDataFrom(interleaved)
+
+        # Primitives
+        geom = Geom(vdata)
+        tris = GeomTriangles(Geom.UHStatic)
+
+        if indices is not None:
+            indices = np.asarray(indices)
+            if indices.dtype not in _INDEX_DTYPES:
+                indices = indices.astype(index_dtype(len(interleaved)))
+            # Keep the mesh's index width (uint16 for small meshes) instead of Panda's default,
+            # then copy the whole index buffer in at once
+            tris.setIndexType(_NUMERIC_TYPES[indices.dtype])
+            handle = tris.modifyVertices().modifyHandle()
+            handle.uncleanSetNumRows(len(indices))
+            handle.copyDataFrom(np.ascontiguousarray(indices))
+        else:
+            # Non-indexed: every three consecutive vertices form a triangle
+            tris.setNonindexedVertices(0, len(interleaved) - len(interleaved) % 3)
+
+        geom.addPrimitive(tris)
+        return geom
 
     def present(self):
         """Present rendered frame."""
@@ -6,9 +6,11 @@ from aurora_engine.rendering.panda_backend import PandaBackend
 from aurora_engine.camera.camera import Camera
 from aurora_engine.ecs.world import World
 from aurora_engine.scene.transform import Transform
-from aurora_engine.rendering.mesh import MeshRenderer, Mesh
+from aurora_engine.rendering.mesh import MeshRenderer, Mesh, create_cube_mesh
 from aurora_engine.core.logging import get_logger
 from aurora_engine.utils.profiler import profile_section
+from aurora_engine.utils.gltf_loader import load_gltf_fixed, is_gltf_path
+from aurora_engine.utils.resource import resolve_path
 from panda3d.core import Vec4, BillboardEffect, Filename, getModelPath, Point3, NodePath, Material, TransparencyAttrib
 import os
 
@@ -104,17 +106,19 @@ class Renderer:
             return
 
         # Ensure we have a NodePath for this entity
-        if not hasattr(mesh_renderer, '_node_path') or mesh_renderer._node_path is None:
+        if mesh_renderer._node_path is None:
             # Check if we have a mesh object or a model path
             if mesh_renderer.mesh:
                 mesh_renderer._node_path = self.backend.create_mesh_node(mesh_renderer.mesh)
-            elif hasattr(mesh_renderer, 'model_path') and mesh_renderer.model_path:
+            elif mesh_renderer.batch:
+                mesh_renderer._node_path = self.backend.upload_meshes_batched(
+                    mesh_renderer.batch, mesh_renderer.batch_offsets, name=f"Batch_{entity.id}")
+            elif mesh_renderer.model_path:
                 # Load model from file
                 try:
                     model_path = mesh_renderer.model_path
                     
                     # Resolve path using utility
-                    from aurora_engine.utils.resource import resolve_path
                     model_path = resolve_path(model_path)
                     
                     # Add directory to model path so textures can be found
@@ -124,9 +128,8 @@ class Renderer:
                     model_path = model_path.replace('\\', '/')
                     
                     # --- CUSTOM GLTF LOADER INTEGRATION ---
-                    if model_path.lower().endswith('.glb') or model_path.lower().endswith('.gltf'):
+                    if is_gltf_path(model_path):
                         try:
-                            from aurora_engine.utils.gltf_loader import load_gltf_fixed
                             # load_gltf_fixed returns a NodePath (wrapping ModelRoot)
                             mesh_renderer._node_path = load_gltf_fixed(self.backend.base.loader, model_path)
                             self.logger.info(f"Loaded GLTF model via custom loader: {model_path}")
@@ -175,7 +178,6 @@ class Renderer:
                 except Exception as e:
                     self.logger.warning(f"Failed to load model {mesh_renderer.model_path}: {e}")
                     self.logger.error("Using fallback cube mesh due to load failure.")
-                    from aurora_engine.rendering.mesh import create_cube_mesh
                     mesh_renderer._node_path = self.backend.create_mesh_node(create_cube_mesh())
             
             if mesh_renderer._node_path:
@@ -184,9 +186,8 @@ class Renderer:
                     mesh_renderer._node_path.reparentTo(self.backend.scene_graph)
                 
                 # Apply texture if provided
-                if hasattr(mesh_renderer, 'texture_path') and mesh_renderer.texture_path:
+                if mesh_renderer.texture_path:
                     try:
-                        from aurora_engine.utils.resource import resolve_path
                         tex_path = resolve_path(mesh_renderer.texture_path)
                         tex_path = tex_path.replace('\\', '/')
                         tex = self.backend.base.loader.loadTexture(tex_path)
@@ -196,11 +197,11 @@ class Renderer:
                         self.logger.warning(f"Failed to load texture {mesh_renderer.texture_path}: {e}")
                 
                 # Apply billboard effect if requested
-                if hasattr(mesh_renderer, 'billboard') and mesh_renderer.billboard:
+                if mesh_renderer.billboard:
                     mesh_renderer._node_path.setEffect(BillboardEffect.makePointEye())
         
         # --- UPDATE & MATERIAL APPLICATION (Runs every frame to handle dynamic node replacement) ---
-        if hasattr(mesh_renderer, '_node_path') and mesh_renderer._node_path:
+        if mesh_renderer._node_path:
             
             # --- Material Fix for Lighting ---
             # Ensure a Panda Material is attached for lighting if none exists
@@ -223,15 +224,15 @@ class Renderer:
             
             # --- Color Application Logic ---
             # 1. Prioritize vertex colors
-            if mesh_renderer.mesh and mesh_renderer.mesh.colors is not None and len(mesh_renderer.mesh.colors) > 0:
+            if mesh_renderer.batch or (mesh_renderer.mesh and mesh_renderer.mesh.colors is not None and len(mesh_renderer.mesh.colors) > 0):
                 # This mesh has vertex colors. Tell Panda to use them for lighting.
                 mesh_renderer._node_path.setColorOff(1)
             else:
                 # 2. No vertex colors, check for texture
-                if hasattr(mesh_renderer, 'texture_path') and mesh_renderer.texture_path:
+                if mesh_renderer.texture_path:
                      # Has a texture, set color to white to not tint it.
                      mesh_renderer._node_path.setColor(1, 1, 1, 1, 1)
-                elif hasattr(mesh_renderer, 'color'):
+                else:
                      # 3. No vertex colors or texture, use the flat color.
                      mesh_renderer._node_path.setColor(Vec4(*mesh_renderer.color), 1)
 
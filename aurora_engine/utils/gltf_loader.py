@@ -4,15 +4,28 @@ import os
 import uuid
 import logging
 import hashlib
+import threading
+import numpy as np
 from panda3d.core import Filename, NodePath
 from aurora_engine.core.logging import get_logger
 
 logger = get_logger()
 
-# Global cache for fixed file paths: original_abs_path -> fixed_temp_abs_path
+# Global cache for fixed file paths: (original_abs_path, cache_dir) -> fixed_temp_abs_path
 _FIXED_FILE_CACHE = {}
 
-def load_gltf_fixed(loader, file_path: str, keep_temp_file: bool = False):
+# Per-file locks so worker threads never write the same fixed file concurrently
+_FIX_LOCKS = {}
+_FIX_LOCKS_GUARD = threading.Lock()
+
+# Extensions handled by load_gltf_fixed
+_GLTF_EXTS = frozenset({'.glb', '.gltf'})
+
+def is_gltf_path(file_path: str) -> bool:
+    """Check whether a path points to a GLTF/GLB file (case-insensitive)."""
+    return os.path.splitext(file_path)[1].lower() in _GLTF_EXTS
+
+def load_gltf_fixed(loader, file_path: str, keep_temp_file: bool = False, cache_dir: str = None):
     """
     Loads a GLTF/GLB file, fixing common issues like missing bufferViews.
     Rewrites the file to a temporary location, loads it, and returns the NodePath.
@@ -22,79 +35,9 @@ def load_gltf_fixed(loader, file_path: str, keep_temp_file: bool = False):
         file_path: Path to the GLTF/GLB file.
         keep_temp_file: If True, the temporary fixed file is NOT deleted, and the function returns (NodePath, temp_file_path).
                         If False (default), it returns just NodePath.
+        cache_dir: Directory to write the fixed file to. Defaults to the shared 'cache' directory.
     """
-    # Resolve absolute path
-    if not os.path.isabs(file_path):
-        file_path = os.path.abspath(file_path)
-        
-    if not os.path.exists(file_path):
-        logger.error(f"File not found: {file_path}")
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    # Check Cache
-    global _FIXED_FILE_CACHE
-    temp_path = None
-    cached = False
-    
-    if file_path in _FIXED_FILE_CACHE:
-        temp_path = _FIXED_FILE_CACHE[file_path]
-        if os.path.exists(temp_path):
-            cached = True
-            # logger.debug(f"Using cached fixed GLTF: {temp_path}")
-        else:
-            # Cache invalid
-            del _FIXED_FILE_CACHE[file_path]
-    
-    if not cached:
-        # Generate a deterministic temp path based on file hash or path hash
-        # Using path hash is faster but less safe if file content changes. 
-        # For dev, let's use path hash + mtime to invalidate if file changed.
-        mtime = os.path.getmtime(file_path)
-        path_hash = hashlib.md5(f"{file_path}_{mtime}".encode('utf-8')).hexdigest()
-        
-        temp_filename = f"{os.path.basename(file_path)}.{path_hash}.fixed"
-        
-        # Use a dedicated cache directory
-        # Try to use 'cache' directory in project root
-        # Assuming project root is 2 levels up from this file (aurora_engine/utils/gltf_loader.py)
-        # But safer to use a relative path from CWD if possible, or just a known cache dir
-        
-        cache_dir = os.path.abspath("cache")
-        if not os.path.exists(cache_dir):
-            try:
-                os.makedirs(cache_dir)
-            except:
-                # Fallback to temp dir if we can't create 'cache'
-                import tempfile
-                cache_dir = tempfile.gettempdir()
-        
-        temp_path = os.path.join(cache_dir, temp_filename)
-        
-        # Determine extension
-        is_glb = False
-        with open(file_path, 'rb') as f:
-            header = f.read(4)
-            if header == b'glTF':
-                is_glb = True
-                if not temp_path.endswith(".glb"): temp_path += ".glb"
-            else:
-                if not temp_path.endswith(".gltf"): temp_path += ".gltf"
-
-        try:
-            # Only process if it doesn't exist (it might exist from a previous run)
-            if not os.path.exists(temp_path):
-                logger.debug(f"Processing GLTF/GLB: {file_path} -> {temp_path}")
-                if is_glb:
-                    _process_glb(file_path, temp_path)
-                else:
-                    _process_gltf(file_path, temp_path)
-            
-            # Update cache
-            _FIXED_FILE_CACHE[file_path] = temp_path
-            
-        except Exception as e:
-            logger.error(f"Failed to fix GLTF {file_path}: {e}")
-            raise
+    temp_path = fix_gltf_file(file_path, cache_dir)
 
     try:
         # Load the fixed file
@@ -121,6 +64,187 @@ def load_gltf_fixed(loader, file_path: str, keep_temp_file: bool = False):
         # keep_temp_file now just controls the return signature.
         pass
 
+def fix_gltf_file(file_path: str, cache_dir: str = None) -> str:
+    """
+    Writes a fixed copy of a GLTF/GLB file to the cache directory and returns its path.
+    Pass cache_dir to write into a caller-owned directory (e.g. one it removes on shutdown).
+    Does not touch Panda3D, so it is safe to call from worker threads; concurrent
+    calls for the same file wait for each other instead of writing it twice.
+    """
+    # Resolve absolute path
+    if not os.path.isabs(file_path):
+        file_path = os.path.abspath(file_path)
+        
+    if not os.path.exists(file_path):
+        logger.error(f"File not found: {file_path}")
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    with _get_fix_lock(file_path):
+        return _fix_gltf_file_locked(file_path, cache_dir)
+
+def _get_fix_lock(file_path: str) -> threading.Lock:
+    """Return the lock serializing fixes of one source file."""
+    with _FIX_LOCKS_GUARD:
+        lock = _FIX_LOCKS.get(file_path)
+        if lock is None:
+            lock = _FIX_LOCKS[file_path] = threading.Lock()
+        return lock
+
+def _fix_gltf_file_locked(file_path: str, cache_dir: str = None) -> str:
+    # Check Cache
+    global _FIXED_FILE_CACHE
+    
+    cache_key = (file_path, cache_dir)
+    if cache_key in _FIXED_FILE_CACHE:
+        temp_path = _FIXED_FILE_CACHE[cache_key]
+        if os.path.exists(temp_path):
+            # logger.debug(f"Using cached fixed GLTF: {temp_path}")
+            return temp_path
+        # Cache invalid
+        del _FIXED_FILE_CACHE[cache_key]
+    
+    # Generate a deterministic temp path based on file hash or path hash
+    # Using path hash is faster but less safe if file content changes. 
+    # For dev, let's use path hash + mtime to invalidate if file changed.
+    mtime = os.path.getmtime(file_path)
+    path_hash = hashlib.md5(f"{file_path}_{mtime}".encode('utf-8')).hexdigest()
+    
+    temp_filename = f"{os.path.basename(file_path)}.{path_hash}.fixed"
+    
+    # Use a dedicated cache directory
+    # Try to use 'cache' directory in project root
+    # Assuming project root is 2 levels up from this file (aurora_engine/utils/gltf_loader.py)
+    # But safer to use a relative path from CWD if possible, or just a known cache dir
+    
+    if cache_dir is None:
+        cache_dir = os.path.abspath("cache")
+    if not os.path.exists(cache_dir):
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+        except:
+            # Fallback to temp dir if we can't create 'cache'
+            import tempfile
+            cache_dir = tempfile.gettempdir()
+    
+    temp_path = os.path.join(cache_dir, temp_filename)
+    
+    # Determine extension
+    is_glb = False
+    with open(file_path, 'rb') as f:
+        header = f.read(4)
+        if header == b'glTF':
+            is_glb = True
+            if not temp_path.endswith(".glb"): temp_path += ".glb"
+        else:
+            if not temp_path.endswith(".gltf"): temp_path += ".gltf"
+
+    try:
+        # Only process if it doesn't exist (it might exist from a previous run)
+        if not os.path.exists(temp_path):
+            logger.debug(f"Processing GLTF/GLB: {file_path} -> {temp_path}")
+            if is_glb:
+                _process_glb(file_path, temp_path)
+            else:
+                _process_gltf(file_path, temp_path)
+        
+        # Update cache
+        _FIXED_FILE_CACHE[cache_key] = temp_path
+        
+    except Exception as e:
+        logger.error(f"Failed to fix GLTF {file_path}: {e}")
+        raise
+
+    return temp_path
+
+def read_gltf_bounds(file_path: str):
+    """
+    Scene bounds of a GLTF/GLB file taken from its POSITION accessors' min/max fields,
+    converted to Panda3D's Z-up axes. Avoids walking every vertex of the loaded model.
+    Returns (min, max) tuples, or None if the file doesn't carry the data.
+    """
+    try:
+        json_data = _read_gltf_json(file_path)
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not read GLTF bounds from {file_path}: {e}")
+        return None
+
+    accessors = json_data.get('accessors', [])
+    meshes = json_data.get('meshes', [])
+    nodes = json_data.get('nodes', [])
+    scenes = json_data.get('scenes')
+    if scenes:
+        roots = scenes[json_data.get('scene', 0)].get('nodes', [])
+    else:
+        children = {child for node in nodes for child in node.get('children', [])}
+        roots = [i for i in range(len(nodes)) if i not in children]
+
+    lo = np.full(3, np.inf)
+    hi = np.full(3, -np.inf)
+    identity = np.identity(4)
+    stack = [(i, identity) for i in roots]
+    while stack:
+        node_idx, parent_matrix = stack.pop()
+        node = nodes[node_idx]
+        world = parent_matrix @ _node_matrix(node)
+        if 'mesh' in node:
+            # Skinned vertices are already in model space in the bind pose
+            matrix = identity if 'skin' in node else world
+            for prim in meshes[node['mesh']].get('primitives', []):
+                acc_idx = prim.get('attributes', {}).get('POSITION')
+                if acc_idx is None:
+                    continue
+                acc = accessors[acc_idx]
+                if 'min' not in acc or 'max' not in acc:
+                    return None
+                # Transform all 8 corners of the accessor box
+                corners = np.array([[x, y, z, 1.0]
+                                    for x in (acc['min'][0], acc['max'][0])
+                                    for y in (acc['min'][1], acc['max'][1])
+                                    for z in (acc['min'][2], acc['max'][2])])
+                points = (corners @ matrix.T)[:, :3]
+                lo = np.minimum(lo, points.min(axis=0))
+                hi = np.maximum(hi, points.max(axis=0))
+        stack.extend((child, world) for child in node.get('children', []))
+
+    if not np.isfinite(lo).all():
+        return None
+    # GLTF is Y-up, Panda3D is Z-up: (x, y, z) -> (x, -z, y)
+    lo_x, lo_y, lo_z = lo.tolist()
+    hi_x, hi_y, hi_z = hi.tolist()
+    return (lo_x, -hi_z, lo_y), (hi_x, -lo_z, hi_y)
+
+def _node_matrix(node) -> np.ndarray:
+    """Local 4x4 transform of a GLTF node."""
+    if 'matrix' in node:
+        # Stored column-major
+        return np.array(node['matrix'], dtype=np.float64).reshape(4, 4).T
+    matrix = np.identity(4)
+    if 'rotation' in node:
+        x, y, z, w = node['rotation']
+        matrix[:3, :3] = [
+            [1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)],
+            [2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)],
+            [2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)],
+        ]
+    if 'scale' in node:
+        matrix[:3, :3] *= node['scale']
+    if 'translation' in node:
+        matrix[:3, 3] = node['translation']
+    return matrix
+
+def _read_gltf_json(file_path: str):
+    """Read just the JSON part of a GLTF/GLB file."""
+    with open(file_path, 'rb') as f:
+        header = f.read(12)
+        if header[:4] != b'glTF':
+            f.seek(0)
+            return json.loads(f.read().decode('utf-8'))
+        # GLB: the JSON chunk always comes first
+        chunk_len, chunk_type = struct.unpack('<II', f.read(8))
+        if chunk_type != 0x4E4F534A:
+            raise ValueError("GLB file missing JSON chunk")
+        return json.loads(f.read(chunk_len).decode('utf-8'))
+
 def _process_glb(input_path, output_path):
     with open(input_path, 'rb') as f:
         data = f.read()
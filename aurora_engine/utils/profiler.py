@@ -1,19 +1,25 @@
 # aurora_engine/utils/profiler.py
 
 import time
-from typing import Dict
-from collections import defaultdict
+from contextlib import nullcontext
+from typing import Dict, Deque
+from collections import defaultdict, deque
 from aurora_engine.core.logging import get_logger
 
 logger = get_logger()
 
+# Set to False for release builds: profile_section() then hands back a shared no-op context,
+# so hot paths wrapped in it cost one function call
+PROFILE_ENABLED = True
+
 class Profiler:
     """
     Simple performance profiler for engine systems.
     """
 
     def __init__(self):
-        self.timings: Dict[str, list] = defaultdict(list)
+        # Only the last 60 samples per section are kept
+        self.timings: Dict[str, Deque[float]] = defaultdict(lambda: deque(maxlen=60))
         self.current_frames: Dict[str, float] = {}
         self.enabled = True
 
@@ -30,11 +36,6 @@ class Profiler:
 
         elapsed = time.perf_counter() - self.current_frames[section_name]
         self.timings[section_name].append(elapsed * 1000.0)  # Convert to ms
-
-        # Keep only last 60 frames
-        if len(self.timings[section_name]) > 60:
-            self.timings[section_name].pop(0)
-
         del self.current_frames[section_name]
 
     def get_average(self, section_name: str) -> float:
@@ -60,18 +61,30 @@ class Profiler:
 _profiler = Profiler()
 
 
-def profile_section(name: str):
-    """Context manager for profiling."""
+_NULL_SECTION = nullcontext()
+
 
-    class ProfileContext:
-        def __enter__(self):
-            _profiler.begin(name)
-            return self
+class _ProfileSection:
+    """Times one `with` block under a section name."""
 
-        def __exit__(self, *args):
-            _profiler.end(name)
+    __slots__ = ("name",)
 
-    return ProfileContext()
+    def __init__(self, name: str):
+        self.name = name
+
+    def __enter__(self):
+        _profiler.begin(self.name)
+        return self
+
+    def __exit__(self, *args):
+        _profiler.end(self.name)
+
+
+def profile_section(name: str):
+    """Context manager for profiling (a no-op when profiling is off)."""
+    if not PROFILE_ENABLED or not _profiler.enabled:
+        return _NULL_SECTION
+    return _ProfileSection(name)
 
 
 # Usage in application
@@ -1,5 +1,9 @@
 import os
 
+# (cwd, relative path) -> resolved absolute path. Only hits are stored, so files created
+# later still resolve, and the cwd in the key keeps a chdir from returning stale entries
+_resolved = {}
+
 def resolve_path(path: str) -> str:
     """
     Resolve a resource path.
@@ -8,26 +12,28 @@ def resolve_path(path: str) -> str:
     2. Relative to CWD
     3. Relative to Parent of CWD (Project Root if running from subdir)
     4. Relative to Grandparent of CWD
+
+    Successful lookups are memoized per working directory, so repeated lookups skip the filesystem.
     """
     if not path:
         return path
         
     if os.path.isabs(path):
         return path
+
+    key = (os.getcwd(), path)
+    resolved = _resolved.get(key)
+    if resolved is not None:
+        return resolved
         
-    # 1. CWD
-    if os.path.exists(path):
-        return os.path.abspath(path)
-        
-    # 2. Parent
-    parent_path = os.path.join("..", path)
-    if os.path.exists(parent_path):
-        return os.path.abspath(parent_path)
-        
-    # 3. Grandparent
-    grandparent_path = os.path.join("../..", path)
-    if os.path.exists(grandparent_path):
-        return os.path.abspath(grandparent_path)
+    for candidate in (
+        path,                         # 1. CWD
+        os.path.join("..", path),     # 2. Parent
+        os.path.join("../..", path),  # 3. Grandparent
+    ):
+        if os.path.exists(candidate):
+            resolved = _resolved[key] = os.path.abspath(candidate)
+            return resolved
         
     # Return original absolute path if not found (let loader fail or handle it)
     return os.path.abspath(path)
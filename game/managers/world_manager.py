@@ -231,19 +231,25 @@ class WorldManager:
             return
             
         chunk_entities = []
+        chunk_origin = np.array([coords[0] * self.chunk_size, coords[1] * self.chunk_size, 0.0], dtype=np.float32)
+        # Procedural props share the default material and carry vertex colors, so their
+        # meshes are drawn as one merged node per chunk instead of one node each
+        batch_meshes = []
+        batch_offsets = []
         
         # Props
         for entity_data, mesh in meshes['props']:
             e = self.world.create_entity()
             t = e.add_component(Transform())
-            t.set_world_position(np.array([entity_data['x'], entity_data['y'], entity_data['z']], dtype=np.float32))
+            pos = np.array([entity_data['x'], entity_data['y'], entity_data['z']], dtype=np.float32)
+            t.set_world_position(pos)
             
             if 'model_path' in entity_data:
                 e.add_component(MeshRenderer(model_path=entity_data['model_path']))
+                if fade_in: e.add_component(FadeInEffect(duration=0.5))
             else:
-                e.add_component(MeshRenderer(mesh=mesh, color=(1.0, 1.0, 1.0, 1.0)))
-                
-            if fade_in: e.add_component(FadeInEffect(duration=0.5))
+                batch_meshes.append(mesh)
+                batch_offsets.append(pos - chunk_origin)
             
             if entity_data['type'] == 'prop':
                 if entity_data['model'] == 'rock':
@@ -256,6 +262,13 @@ class WorldManager:
             
             e.add_component(StaticBody())
             chunk_entities.append(e)
+
+        if batch_meshes:
+            props = self.world.create_entity()
+            props.add_component(Transform()).set_world_position(chunk_origin)
+            props.add_component(MeshRenderer(batch=batch_meshes, batch_offsets=np.array(batch_offsets)))
+            if fade_in: props.add_component(FadeInEffect(duration=0.5))
+            chunk_entities.append(props)
                 
         # Terrain
         if meshes['terrain']:
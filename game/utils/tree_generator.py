@@ -78,33 +78,31 @@ def create_procedural_tree_mesh(seed: int, height: float = 4.0, radius: float =
             rings = 4 # Reduced from 6
             base_idx = len(vertices)
             
-            for r in range(rings + 1):
-                phi = r * np.pi / rings
-                for s in range(segments + 1):
-                    theta = s * 2 * np.pi / segments
-                    
-                    # Noise for irregularity
-                    noise = rng.uniform(0.8, 1.2)
-                    
-                    x = np.sin(phi) * np.cos(theta) * size * noise
-                    y = np.sin(phi) * np.sin(theta) * size * noise
-                    z = np.cos(phi) * size * noise
-                    
-                    pos = np.array(center) + np.array([x, y, z])
-                    vertices.append(pos)
-                    normals.append([x, y, z]) # Radial
-                    uvs.append([s/segments, r/rings])
-                    colors.append(color)
-                    
-            for r in range(rings):
-                for s in range(segments):
-                    curr = base_idx + r * (segments + 1) + s
-                    next_s = curr + 1
-                    next_r = curr + (segments + 1)
-                    next_both = next_r + 1
+            # Whole (rings+1) x (segments+1) grid at once
+            ring_steps = np.arange(rings + 1)[:, None]
+            seg_steps = np.arange(segments + 1)[None, :]
+            phi = ring_steps * np.pi / rings
+            theta = seg_steps * 2 * np.pi / segments
+            
+            # Noise for irregularity (drawn in the same vertex order as before, so seeds give the same trees)
+            noise = np.array([rng.uniform(0.8, 1.2) for _ in range((rings + 1) * (segments + 1))]).reshape(rings + 1, segments + 1)
+            
+            x = np.sin(phi) * np.cos(theta) * size * noise
+            y = np.sin(phi) * np.sin(theta) * size * noise
+            z = np.cos(phi) * size * noise
+            radial = np.stack([x, y, z], axis=-1).reshape(-1, 3)
+            
+            vertices.extend(np.array(center) + radial)
+            normals.extend(radial) # Radial
+            u, v = np.broadcast_arrays(seg_steps / segments, ring_steps / rings)
+            uvs.extend(np.stack([u, v], axis=-1).reshape(-1, 2))
+            colors.extend([color] * len(radial))
                     
-                    indices.extend([curr, next_r, next_s])
-                    indices.extend([next_s, next_r, next_both])
+            curr = base_idx + ring_steps[:-1] * (segments + 1) + seg_steps[:, :-1]
+            next_s = curr + 1
+            next_r = curr + (segments + 1)
+            next_both = next_r + 1
+            indices.extend(np.stack([curr, next_r, next_s, next_s, next_r, next_both], axis=-1).ravel().tolist())
 
         # --- Recursive Generation ---
         trunk_color = [0.4 + rng.uniform(-0.05, 0.05), 0.3 + rng.uniform(-0.05, 0.05), 0.2, 1.0]